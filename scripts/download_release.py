@@ -6,23 +6,68 @@ extracting it to the specified directory, and managing version tracking.
 """
 
 import argparse
-import io
 import json
 import shutil
 import subprocess
 import sys
+import urllib.error
 import urllib.request
 import zipfile
 from pathlib import Path
 from typing import Optional
 
+# Upper bound for the icon generation step so a stuck uv can't hang the install
+ICON_TIMEOUT_SECONDS = 120
 
-def get_latest_version(repo: str, verbose: bool = False) -> str:
+# ETag and tag of the last "latest release" API response, stored next to .version
+RELEASE_CACHE_FILE = ".version.etag"
+
+
+def load_release_cache(install_dir: str) -> Optional[tuple]:
+    """Load the cached (etag, tag) of the latest release lookup.
+
+    Args:
+        install_dir: Installation directory
+
+    Returns:
+        (etag, tag) tuple, or None if there is no usable cache
+    """
+    cache_file = Path(install_dir) / RELEASE_CACHE_FILE
+    try:
+        data = json.loads(cache_file.read_text())
+        return data["etag"], data["tag"]
+    except Exception:
+        return None
+
+
+def save_release_cache(install_dir: str, etag: str, tag: str) -> None:
+    """Save the ETag and tag of a latest release lookup.
+
+    Args:
+        install_dir: Installation directory
+        etag: ETag header returned by the GitHub API
+        tag: Release tag the ETag belongs to
+    """
+    install_path = Path(install_dir)
+    install_path.mkdir(parents=True, exist_ok=True)
+    (install_path / RELEASE_CACHE_FILE).write_text(
+        json.dumps({"etag": etag, "tag": tag})
+    )
+
+
+def get_latest_version(
+    repo: str, verbose: bool = False, install_dir: Optional[str] = None
+) -> str:
     """Query GitHub API for the latest release tag.
 
+    When install_dir is given, the ETag of the previous lookup is sent as
+    If-None-Match; an unchanged release then answers 304 with no body (and
+    does not count against the API rate limit).
+
     Args:
         repo: GitHub repository in format 'owner/repo'
         verbose: Whether to print progress messages
+        install_dir: Installation directory holding the release cache
 
     Returns:
         The latest release tag name, or 'main' if no releases exist
@@ -30,20 +75,37 @@ def get_latest_version(repo: str, verbose: bool = False) -> str:
     if verbose:
         print("Checking for latest release...")
 
+    cached = load_release_cache(install_dir) if install_dir else None
+    headers = {
+        "User-Agent": "pyNegative-Installer",
+        "Accept": "application/vnd.github.v3+json",
+    }
+    if cached:
+        headers["If-None-Match"] = cached[0]
+
     try:
         req = urllib.request.Request(
             f"https://api.github.com/repos/{repo}/releases/latest",
-            headers={
-                "User-Agent": "pyNegative-Installer",
-                "Accept": "application/vnd.github.v3+json",
-            },
+            headers=headers,
         )
         with urllib.request.urlopen(req, timeout=10) as response:
             data = json.loads(response.read().decode())
             tag = data.get("tag_name", "main")
+            etag = response.headers.get("ETag")
+            if install_dir and isinstance(etag, str):
+                save_release_cache(install_dir, etag, tag)
             if verbose:
                 print(f"Latest release found: {tag}")
             return tag
+    except urllib.error.HTTPError as e:
+        if e.code == 304 and cached:
+            if verbose:
+                print(f"Latest release unchanged: {cached[1]}")
+            return cached[1]
+        if verbose:
+            print(f"Could not check releases: {e}")
+            print("Falling back to main branch")
+        return "main"
     except Exception as e:
         if verbose:
             print(f"Could not check releases: {e}")
@@ -77,10 +139,12 @@ def download_and_extract(
         if verbose:
             print(f"Downloading {version}...")
 
+    zip_path = Path(dest_dir).with_suffix(".zip.tmp")
     try:
-        # Download
+        # Download, streaming to disk so memory use stays flat for large zips
         with urllib.request.urlopen(url, timeout=60) as response:
-            zip_data = io.BytesIO(response.read())
+            with open(zip_path, "wb") as f:
+                shutil.copyfileobj(response, f, length=1 << 16)
 
         if verbose:
             print("Download complete, extracting...")
@@ -90,7 +154,7 @@ def download_and_extract(
         if temp_extract.exists():
             shutil.rmtree(temp_extract)
 
-        with zipfile.ZipFile(zip_data, "r") as zf:
+        with zipfile.ZipFile(zip_path, "r") as zf:
             zf.extractall(temp_extract)
 
         # Find the extracted directory (usually like pyNegative-main/ or pyNegative-v1.0.0/)
@@ -102,7 +166,8 @@ def download_and_extract(
         source_dir = subdirs[0]
         dest_path = Path(dest_dir)
 
-        # Remove old install if exists
+        # Remove old install if exists, keeping the release lookup cache
+        release_cache = load_release_cache(dest_dir)
         if dest_path.exists():
             if verbose:
                 print("Removing old installation...")
@@ -110,6 +175,8 @@ def download_and_extract(
 
         # Move to final location
         shutil.move(str(source_dir), str(dest_path))
+        if release_cache:
+            save_release_cache(dest_dir, *release_cache)
         shutil.rmtree(temp_extract)
 
         if verbose:
@@ -120,18 +187,31 @@ def download_and_extract(
         if icon_script.exists():
             if verbose:
                 print("Generating icons...")
+            # uv provides the project environment (Pillow); without it fall
+            # back to the interpreter running this script
+            uv = shutil.which("uv")
+            if uv:
+                cmd = [uv, "run", "--python", "3", "python", str(icon_script)]
+            else:
+                cmd = [sys.executable, str(icon_script)]
             try:
                 result = subprocess.run(
-                    ["uv", "run", "--python", "3", "python", icon_script],
-                    capture_output=True,
+                    cmd,
+                    stdout=subprocess.DEVNULL,
+                    stderr=subprocess.PIPE,
                     text=True,
                     cwd=dest_dir,
+                    timeout=ICON_TIMEOUT_SECONDS,
                 )
                 if result.returncode == 0:
                     if verbose:
                         print("Icons generated successfully!")
                 else:
                     print(f"Warning: Icon generation failed: {result.stderr}")
+            except subprocess.TimeoutExpired:
+                print(
+                    f"Warning: Icon generation timed out after {ICON_TIMEOUT_SECONDS}s"
+                )
             except Exception as e:
                 print(f"Warning: Could not generate icons: {e}")
 
@@ -140,6 +220,8 @@ def download_and_extract(
     except Exception as e:
         print(f"Error downloading: {e}")
         return False
+    finally:
+        zip_path.unlink(missing_ok=True)
 
 
 def check_update_available(
@@ -242,7 +324,9 @@ def main() -> int:
         if verbose:
             print(f"Installing specified version: {latest}")
     else:
-        latest = get_latest_version(args.repo, verbose=verbose)
+        latest = get_latest_version(
+            args.repo, verbose=verbose, install_dir=args.install_dir
+        )
 
     # Check current version
     current = load_version(args.install_dir)
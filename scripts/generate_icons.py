@@ -9,6 +9,26 @@ from pathlib import Path
 import sys
 
 
+def build_icon_pyramid(img, sizes):
+    """Resize img to every size in sizes, largest first.
+
+    Each level is resampled from the smallest already-built level that is at
+    least twice the target size, so LANCZOS only walks the full-resolution
+    source for the largest icons.
+
+    Returns a dict mapping size -> square RGBA image.
+    """
+    levels = {}
+    for size in sorted(set(sizes), reverse=True):
+        base = img
+        for built_size in sorted(levels):
+            if built_size >= 2 * size:
+                base = levels[built_size]
+                break
+        levels[size] = base.resize((size, size), Image.Resampling.LANCZOS)
+    return levels
+
+
 def generate_icons():
     """Generate all required icon formats from the main icon."""
 
@@ -31,35 +51,34 @@ def generate_icons():
     if img.mode != "RGBA":
         img = img.convert("RGBA")
 
+    ico_sizes = [16, 32, 48, 256]
+    mac_sizes = [16, 32, 128, 256, 512, 1024]
+    retina_sizes = [size * 2 for size in mac_sizes if size <= 512]
+    icons = build_icon_pyramid(img, [256] + ico_sizes + mac_sizes + retina_sizes)
+
     # Generate 256x256 PNG (used by Linux and general purpose)
     print("Generating 256x256 PNG...")
-    img_256 = img.resize((256, 256), Image.Resampling.LANCZOS)
+    img_256 = icons[256]
     png_path = icons_dir / "pynegative_256.png"
     img_256.save(str(png_path), "PNG")
     print(f"  Saved: {png_path}")
 
     # Generate Windows ICO file (multi-resolution)
     print("Generating Windows ICO file...")
-    sizes = [16, 32, 48, 256]
-    ico_images = []
-
-    for size in sizes:
-        resized = img.resize((size, size), Image.Resampling.LANCZOS)
-        ico_images.append(resized)
+    ico_images = [icons[size] for size in ico_sizes]
 
     ico_path = icons_dir / "pynegative.ico"
     # Save with the largest image first, then the rest
     ico_images[-1].save(
         str(ico_path),
         format="ICO",
-        sizes=[(s, s) for s in sizes],
+        sizes=[(s, s) for s in ico_sizes],
         append_images=ico_images[:-1],
     )
-    print(f"  Saved: {ico_path} (sizes: {sizes})")
+    print(f"  Saved: {ico_path} (sizes: {ico_sizes})")
 
     # Generate macOS ICNS file (multi-resolution)
     print("Generating macOS ICNS file...")
-    mac_sizes = [16, 32, 128, 256, 512, 1024]
 
     # For ICNS, we need to create a set of PNGs and then combine them
     # PIL doesn't directly support ICNS, so we'll use iconutil on macOS
@@ -70,14 +89,14 @@ def generate_icons():
 
     for size in mac_sizes:
         # Normal resolution
-        resized = img.resize((size, size), Image.Resampling.LANCZOS)
+        resized = icons[size]
         icon_name = f"icon_{size}x{size}.png"
         icon_path = icns_dir / icon_name
         resized.save(str(icon_path), "PNG")
 
         # High resolution (@2x) for sizes <= 512
         if size <= 512:
-            resized_2x = img.resize((size * 2, size * 2), Image.Resampling.LANCZOS)
+            resized_2x = icons[size * 2]
             icon_name_2x = f"icon_{size}x{size}@2x.png"
             icon_path_2x = icns_dir / icon_name_2x
             resized_2x.save(str(icon_path_2x), "PNG")
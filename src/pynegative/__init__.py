@@ -1,6 +1,7 @@
 from .core import (
     apply_tone_map,
     open_raw,
+    open_raw_many,
     extract_thumbnail,
     calculate_auto_exposure,
     sharpen_image,
@@ -9,6 +10,7 @@ from .core import (
     de_haze_image,
     save_sidecar,
     load_sidecar,
+    load_sidecars_for_dir,
     SUPPORTED_EXTS,
     HEIF_SUPPORTED,
 )
@@ -16,6 +18,7 @@ from .core import (
 __all__ = [
     "apply_tone_map",
     "open_raw",
+    "open_raw_many",
     "extract_thumbnail",
     "calculate_auto_exposure",
     "sharpen_image",
@@ -24,6 +27,7 @@ __all__ = [
     "de_haze_image",
     "save_sidecar",
     "load_sidecar",
+    "load_sidecars_for_dir",
     "SUPPORTED_EXTS",
     "HEIF_SUPPORTED",
 ]
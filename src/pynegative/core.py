@@ -1,14 +1,19 @@
 #!/usr/bin/env python3
 import json
+import os
 import time
 import math
 import logging
-import re
+import struct
+import threading
 from pathlib import Path
 
 from datetime import datetime
-from functools import lru_cache
 from io import BytesIO
+from collections import OrderedDict
+from concurrent.futures import Future, ThreadPoolExecutor, wait
+from contextlib import contextmanager
+from functools import lru_cache
 
 import numpy as np
 import rawpy
@@ -19,9 +24,44 @@ try:
 except ImportError:
     cv2 = None
 
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+try:
+    from turbojpeg import TJPF_RGB, TJSAMP_420, TurboJPEG
+
+    _TURBOJPEG = TurboJPEG()
+except Exception:  # Module missing, or the libturbojpeg library isn't found
+    _TURBOJPEG = None
+
+try:
+    import cupy
+
+    CUPY_AVAILABLE = cupy.cuda.runtime.getDeviceCount() > 0
+except Exception:  # Not installed, or no usable CUDA driver/device
+    cupy = None
+    CUPY_AVAILABLE = False
+
+try:
+    from numba import njit, prange
+
+    NUMBA_AVAILABLE = True
+except ImportError:
+    NUMBA_AVAILABLE = False
+
+# Numba's default (workqueue) threading layer does not allow parallel kernels
+# to be launched from several threads at once. Each kernel already uses every
+# core, so concurrent callers (preview worker, export threads) take turns.
+_NUMBA_LOCK = threading.Lock()
+
 # Configure logger for this module
 logger = logging.getLogger(__name__)
 
+# Rec. 709 luminance weights
+LUM_WEIGHTS = np.array([0.2126, 0.7152, 0.0722], dtype=np.float32)
+
 RAW_EXTS = {
     ".cr2",
     ".cr3",
@@ -37,6 +77,11 @@ RAW_EXTS = {
 STD_EXTS = {".jpg", ".jpeg", ".png", ".webp", ".tiff", ".tif", ".heic", ".heif"}
 SUPPORTED_EXTS = tuple(RAW_EXTS | STD_EXTS)
 
+# Shared pool for open_raw_many; decoding releases the GIL
+_OPEN_RAW_POOL = ThreadPoolExecutor(
+    max_workers=os.cpu_count() or 1, thread_name_prefix="open_raw"
+)
+
 try:
     import pillow_heif
 
@@ -52,7 +97,25 @@ def warmup_hardware_acceleration():
     Proactively initializes OpenCV OpenCL hardware acceleration.
     This can take several seconds on some systems and is best done in a background thread
     on application startup to avoid UI hangs during the first effect application.
+    Also compiles (or loads from cache) the Numba kernels.
     """
+    if NUMBA_AVAILABLE:
+        try:
+            start = time.perf_counter()
+            dummy = np.zeros((4, 4, 3), dtype=np.float32)
+            # Float, uint8 and uint16 outputs are separate specializations
+            for dtype in (np.float32, np.uint8, np.uint16):
+                out = np.empty((4, 4, 3), dtype=dtype)
+                _fused_tone_map(dummy, out, contrast=1.1, shadows=0.1)
+            with _NUMBA_LOCK:
+                _unsharp_blend_kernel(
+                    dummy, dummy, np.zeros((4, 4), dtype=np.uint8), 0.5, dummy.copy()
+                )
+            elapsed = (time.perf_counter() - start) * 1000
+            logger.debug(f"Numba kernels ready in {elapsed:.2f}ms")
+        except Exception as e:
+            logger.warning(f"Numba kernel warmup failed: {e}")
+
     if cv2 is None:
         return
 
@@ -71,6 +134,445 @@ def warmup_hardware_acceleration():
         logger.warning(f"Hardware acceleration warmup failed: {e}")
 
 
+if NUMBA_AVAILABLE:
+
+    @njit(parallel=True, nogil=True, fastmath=True, cache=True, error_model="numpy")
+    def _tone_map_kernel(
+        img,
+        out,
+        r_mul,
+        g_mul,
+        b_mul,
+        contrast,
+        blacks,
+        level_scale,
+        shadows,
+        highlights,
+        saturation,
+        out_scale,
+        with_stats,
+    ):
+        """
+        The whole apply_tone_map pipeline in one pass: White Balance + Exposure,
+        Contrast, Tone EQ (Blacks, Whites, Shadows & Highlights), Saturation,
+        clip statistics and the final clip. Each pixel is read once and written
+        once to out; luminance and masks stay in registers.
+        Clipped values are multiplied by out_scale (float32) on store, so an
+        integer out (scale 255 / 65535) receives display pixels directly.
+        Returns (shadow clipped count, highlight clipped count, sum) of the
+        unclipped values, or zeros when with_stats is False (the reductions
+        cost about a quarter of the kernel's time).
+        """
+        h, w, _ = img.shape
+        tone_eq = (
+            blacks != 0.0 or level_scale != 1.0 or shadows != 0.0 or highlights != 0.0
+        )
+        n_low = 0
+        n_high = 0
+        total = 0.0
+        for i in prange(h):
+            for j in range(w):
+                # WB and Exposure are folded into one multiplier per channel
+                r = img[i, j, 0] * r_mul
+                g = img[i, j, 1] * g_mul
+                b = img[i, j, 2] * b_mul
+
+                if contrast != 1.0:
+                    r = (r - 0.5) * contrast + 0.5
+                    g = (g - 0.5) * contrast + 0.5
+                    b = (b - 0.5) * contrast + 0.5
+
+                # Luminance is computed once: the weights sum to 1, so the Tone
+                # EQ (a shared per-pixel gain and offset) updates it in closed form
+                lum = 0.0
+                if tone_eq or saturation != 1.0:
+                    lum = 0.2126 * r + 0.7152 * g + 0.0722 * b
+
+                if tone_eq:
+                    # Unclipped luminance allows highlight recovery of >1.0 values
+                    lum_c = min(max(lum, 0.0), 1.0)
+
+                    gain = level_scale
+                    offset = -blacks * level_scale
+                    if shadows != 0.0:
+                        s_mask = (1.0 - lum_c) * (1.0 - lum_c)
+                        s_gain = 1.0 + shadows * s_mask
+                        gain *= s_gain
+                        offset *= s_gain
+
+                    h_term = 0.0
+                    if highlights < 0.0:
+                        lum_p = max(lum, 0.0)
+                        h_div = 1.0 + -highlights * lum_p * lum_p
+                        gain /= h_div
+                        offset /= h_div
+                    elif highlights > 0.0:
+                        h_term = highlights * lum_c * lum_c
+                        gain *= 1.0 - h_term
+                        offset *= 1.0 - h_term
+
+                    r = r * gain + offset + h_term
+                    g = g * gain + offset + h_term
+                    b = b * gain + offset + h_term
+                    lum = lum * gain + offset + h_term
+
+                if saturation != 1.0:
+                    # Clipped luminance avoids color shifts in over-exposed areas
+                    lum_s = min(max(lum, 0.0), 1.0)
+                    r = lum_s + (r - lum_s) * saturation
+                    g = lum_s + (g - lum_s) * saturation
+                    b = lum_s + (b - lum_s) * saturation
+
+                if with_stats:
+                    n_low += (r < 0.0) + (g < 0.0) + (b < 0.0)
+                    n_high += (r > 1.0) + (g > 1.0) + (b > 1.0)
+                    total += r + g + b
+
+                # Scale in float32 so integer output truncates like float_to_uint8
+                out[i, j, 0] = np.float32(min(max(r, 0.0), 1.0)) * out_scale
+                out[i, j, 1] = np.float32(min(max(g, 0.0), 1.0)) * out_scale
+                out[i, j, 2] = np.float32(min(max(b, 0.0), 1.0)) * out_scale
+        return n_low, n_high, total
+
+    @njit(parallel=True, nogil=True, fastmath=True, cache=True)
+    def _unsharp_blend_kernel(img, blur, edges, amount, out):
+        """
+        Fused edge-gated unsharp mask: out = clip(img + amount * (img - blur))
+        on edge pixels, img elsewhere. Releases the GIL while running.
+        """
+        h, w, c = img.shape
+        for i in prange(h):
+            for j in range(w):
+                if edges[i, j] > 0:
+                    for k in range(c):
+                        v = img[i, j, k] + amount * (img[i, j, k] - blur[i, j, k])
+                        out[i, j, k] = min(max(v, 0.0), 1.0)
+                else:
+                    for k in range(c):
+                        out[i, j, k] = min(max(img[i, j, k], 0.0), 1.0)
+
+
+def _luminance(img):
+    """
+    Rec. 709 luminance of an HxWx3 image as a single matrix-vector product,
+    one pass over the pixels instead of three slice multiplies and two adds.
+    """
+    return img @ LUM_WEIGHTS
+
+
+def _apply_tone_eq_numpy(
+    img, blacks, level_scale, shadows, highlights, track_lum=False
+):
+    """
+    NumPy Shadows & Highlights, on an image whose Levels (Blacks & Whites) are
+    already applied. Mutates img. Like the fused kernel, the masks are driven
+    by the luminance before Levels.
+    Returns (img, lum); with track_lum, lum is the luminance of the result,
+    updated on an HxW buffer alongside img, otherwise None.
+    """
+    # Calculate luminance (Rec. 709), then undo Levels on it for the masks
+    lum = _luminance(img)
+    out_lum = lum.copy() if track_lum else None
+    if level_scale != 1.0:
+        lum /= level_scale
+    if blacks != 0.0:
+        lum += blacks
+
+    # Masks are built in place on HxW buffers and broadcast over the channels,
+    # so no HxWx3 temporaries are allocated.
+    if shadows != 0.0 or highlights > 0:
+        lum_c = np.clip(lum, 0, 1)
+
+    if shadows != 0.0:
+        s_gain = np.subtract(1.0, lum_c, dtype=img.dtype)
+        np.square(s_gain, out=s_gain)
+        s_gain *= shadows
+        s_gain += 1.0
+        img *= s_gain[:, :, np.newaxis]
+        if track_lum:
+            out_lum *= s_gain
+
+    if highlights != 0.0:
+        if highlights < 0:
+            # RECOVERY: Compress over-exposed highlights
+            # Use unclipped luminance for the mask to distinguish clipped areas
+            h_div = np.maximum(lum, 0, out=lum)
+            np.square(h_div, out=h_div)
+            h_div *= abs(highlights)
+            h_div += 1.0
+            img /= h_div[:, :, np.newaxis]
+            if track_lum:
+                out_lum /= h_div
+        else:
+            # BOOST: Brighten highlights
+            h_term = np.square(lum_c, out=lum_c)
+            h_term *= highlights
+            # Use a blend that caps at 1.0
+            h_gain = np.subtract(1.0, h_term, dtype=img.dtype)
+            img *= h_gain[:, :, np.newaxis]
+            img += h_term[:, :, np.newaxis]
+            if track_lum:
+                out_lum *= h_gain
+                out_lum += h_term
+
+    return img, out_lum
+
+
+def float_to_uint8(img, out=None):
+    """
+    Scales a normalized (0.0-1.0) float image to uint8.
+    Writes straight into the uint8 output so no float temporary is allocated.
+    Values are truncated, matching (img * 255).astype(np.uint8).
+    """
+    if out is None:
+        out = np.empty(img.shape, dtype=np.uint8)
+    np.multiply(img, 255.0, out=out, casting="unsafe")
+    return out
+
+
+def float_to_uint16(img, out=None):
+    """
+    Scales a normalized (0.0-1.0) float image to uint16 for high bit-depth export.
+    Like float_to_uint8, the result is written without a float temporary.
+    """
+    if out is None:
+        out = np.empty(img.shape, dtype=np.uint16)
+    np.multiply(img, 65535.0, out=out, casting="unsafe")
+    return out
+
+
+def uint_to_float(img, max_value=255.0):
+    """
+    Normalizes integer pixels to a 0.0-1.0 float32 image.
+    The cast happens inside the ufunc loop, so only the float32 result is
+    allocated (no astype copy followed by a second division temporary).
+    """
+    return np.divide(img, np.float32(max_value), dtype=np.float32)
+
+
+def _wb_multipliers(temperature, tint):
+    """Per-channel (R, G, B) gains for the relative White Balance sliders."""
+    t_scale = 0.4
+    tint_scale = 0.2
+
+    # Scalars: math.exp skips NumPy's ufunc dispatch
+    r_mult = math.exp(temperature * t_scale - tint * (tint_scale / 2))
+    g_mult = math.exp(tint * tint_scale)
+    b_mult = math.exp(-temperature * t_scale - tint * (tint_scale / 2))
+    return r_mult, g_mult, b_mult
+
+
+def _can_fuse_tone_map(img):
+    return NUMBA_AVAILABLE and img.dtype == np.float32 and img.shape[-1:] == (3,)
+
+
+def _fused_tone_map(
+    img,
+    out,
+    exposure=0.0,
+    contrast=1.0,
+    blacks=0.0,
+    whites=1.0,
+    shadows=0.0,
+    highlights=0.0,
+    saturation=1.0,
+    temperature=0.0,
+    tint=0.0,
+    with_stats=True,
+):
+    """
+    Runs _tone_map_kernel from img into out. A float32 out receives the clipped
+    0-1 result; uint8/uint16 outs receive scaled display pixels.
+    Returns (shadow clipped count, highlight clipped count, sum), all zero
+    unless with_stats.
+    """
+    if out.dtype == np.uint8:
+        out_scale = 255.0
+    elif out.dtype == np.uint16:
+        out_scale = 65535.0
+    else:
+        out_scale = 1.0
+
+    scalars = _tone_map_scalars(
+        exposure,
+        contrast,
+        blacks,
+        whites,
+        shadows,
+        highlights,
+        saturation,
+        temperature,
+        tint,
+    )
+    with _NUMBA_LOCK:
+        return _tone_map_kernel(
+            img, out, *scalars, np.float32(out_scale), bool(with_stats)
+        )
+
+
+def _level_scale(blacks, whites):
+    """Gain of the Whites level adjustment, 1 / (whites - blacks)."""
+    if whites == 1.0:
+        return 1.0
+    denom = whites - blacks
+    if abs(denom) < 1e-6:
+        denom = 1e-6
+    return 1.0 / denom
+
+
+def _tone_map_scalars(
+    exposure,
+    contrast,
+    blacks,
+    whites,
+    shadows,
+    highlights,
+    saturation,
+    temperature,
+    tint,
+):
+    """
+    Slider values as the per-pixel constants of the fused kernels:
+    (r_mul, g_mul, b_mul, contrast, blacks, level_scale, shadows, highlights,
+    saturation), with WB and Exposure folded into the channel multipliers.
+    """
+    exposure_mul = 2**exposure
+    r_mult, g_mult, b_mult = _wb_multipliers(temperature, tint)
+    level_scale = _level_scale(blacks, whites)
+
+    return (
+        float(r_mult * exposure_mul),
+        float(g_mult * exposure_mul),
+        float(b_mult * exposure_mul),
+        float(contrast),
+        float(blacks),
+        float(level_scale),
+        float(shadows),
+        float(highlights),
+        float(saturation),
+    )
+
+
+# Below this many values the host <-> device copies outweigh the GPU speedup
+GPU_MIN_SIZE = 4_000_000
+
+if CUPY_AVAILABLE:
+    # CUDA version of _tone_map_kernel, one thread per pixel. It writes the
+    # unclipped result so the clip statistics can be reduced on the device.
+    _tone_map_gpu_kernel = cupy.ElementwiseKernel(
+        "raw float32 img, float32 r_mul, float32 g_mul, float32 b_mul, "
+        "float32 contrast, float32 blacks, float32 level_scale, float32 shadows, "
+        "float32 highlights, float32 saturation, bool tone_eq",
+        "raw float32 out",
+        """
+        float r = img[3 * i] * r_mul;
+        float g = img[3 * i + 1] * g_mul;
+        float b = img[3 * i + 2] * b_mul;
+
+        if (contrast != 1.0f) {
+            r = (r - 0.5f) * contrast + 0.5f;
+            g = (g - 0.5f) * contrast + 0.5f;
+            b = (b - 0.5f) * contrast + 0.5f;
+        }
+
+        float lum = 0.0f;
+        if (tone_eq || saturation != 1.0f) {
+            lum = 0.2126f * r + 0.7152f * g + 0.0722f * b;
+        }
+
+        if (tone_eq) {
+            float lum_c = fminf(fmaxf(lum, 0.0f), 1.0f);
+            float gain = level_scale;
+            float offset = -blacks * level_scale;
+            if (shadows != 0.0f) {
+                float s_gain = 1.0f + shadows * (1.0f - lum_c) * (1.0f - lum_c);
+                gain *= s_gain;
+                offset *= s_gain;
+            }
+            float h_term = 0.0f;
+            if (highlights < 0.0f) {
+                float lum_p = fmaxf(lum, 0.0f);
+                float h_div = 1.0f - highlights * lum_p * lum_p;
+                gain /= h_div;
+                offset /= h_div;
+            } else if (highlights > 0.0f) {
+                h_term = highlights * lum_c * lum_c;
+                gain *= 1.0f - h_term;
+                offset *= 1.0f - h_term;
+            }
+            r = r * gain + offset + h_term;
+            g = g * gain + offset + h_term;
+            b = b * gain + offset + h_term;
+            lum = lum * gain + offset + h_term;
+        }
+
+        if (saturation != 1.0f) {
+            float lum_s = fminf(fmaxf(lum, 0.0f), 1.0f);
+            r = lum_s + (r - lum_s) * saturation;
+            g = lum_s + (g - lum_s) * saturation;
+            b = lum_s + (b - lum_s) * saturation;
+        }
+
+        out[3 * i] = r;
+        out[3 * i + 1] = g;
+        out[3 * i + 2] = b;
+        """,
+        "pynegative_tone_map",
+    )
+
+
+def _can_gpu_tone_map(img):
+    return (
+        CUPY_AVAILABLE
+        and img.size >= GPU_MIN_SIZE
+        and img.dtype == np.float32
+        and img.shape[-1:] == (3,)
+    )
+
+
+def _gpu_tone_map(img, calculate_stats, out=None, **settings):
+    """Runs _tone_map_gpu_kernel on the CUDA device. Returns (img, stats)."""
+    scalars = _tone_map_scalars(**settings)
+    _, _, _, _, blacks, level_scale, shadows, highlights, _ = scalars
+    tone_eq = blacks != 0.0 or level_scale != 1.0 or shadows != 0.0 or highlights != 0.0
+
+    d_img = cupy.asarray(np.ascontiguousarray(img))
+    d_out = cupy.empty_like(d_img)
+    _tone_map_gpu_kernel(
+        d_img,
+        *(np.float32(v) for v in scalars),
+        np.bool_(tone_eq),
+        d_out,
+        size=img.size // 3,
+    )
+    del d_img
+
+    stats = {}
+    if calculate_stats:
+        clipped_shadows = int(cupy.count_nonzero(d_out < 0.0))
+        clipped_highlights = int(cupy.count_nonzero(d_out > 1.0))
+        stats = {
+            "pct_shadows_clipped": clipped_shadows / img.size * 100,
+            "pct_highlights_clipped": clipped_highlights / img.size * 100,
+            "mean": float(d_out.mean()),
+        }
+    cupy.clip(d_out, 0.0, 1.0, out=d_out)
+    if out is not None:
+        return d_out.get(out=out), stats
+    return cupy.asnumpy(d_out), stats
+
+
+def _clip_stats(img, total_pixels):
+    """Clipping percentages and mean of an unclipped tone-mapped image."""
+    clipped_shadows = np.count_nonzero(img < 0.0)
+    clipped_highlights = np.count_nonzero(img > 1.0)
+    return {
+        "pct_shadows_clipped": clipped_shadows / total_pixels * 100,
+        "pct_highlights_clipped": clipped_highlights / total_pixels * 100,
+        "mean": img.mean(),
+    }
+
+
 def apply_tone_map(
     img,
     exposure=0.0,
@@ -83,106 +585,129 @@ def apply_tone_map(
     temperature=0.0,
     tint=0.0,
     calculate_stats=True,
+    out=None,
 ):
     """
     Applies White Balance -> Exposure -> Levels -> Tone EQ -> Saturation -> Base Curve
     Optimized for performance with in-place operations and minimal allocations.
+    With Numba, float32 RGB images go through a single fused kernel instead,
+    and large ones run as a CUDA kernel when CuPy finds a GPU.
+    The result is written into out (a float32 array shaped like img) when
+    given, so callers rendering repeatedly can reuse one buffer; the input
+    array itself is never modified unless passed as out.
     """
     start_time = time.perf_counter()
-    # Create a single copy at the start to protect the input array
-    img = img.copy()
     total_pixels = img.size
 
-    # 0. White Balance (Relative Scaling)
-    if temperature != 0.0 or tint != 0.0:
-        t_scale = 0.4
-        tint_scale = 0.2
-
-        r_mult = np.exp(temperature * t_scale - tint * (tint_scale / 2))
-        g_mult = np.exp(tint * tint_scale)
-        b_mult = np.exp(-temperature * t_scale - tint * (tint_scale / 2))
-
-        img[:, :, 0] *= r_mult
-        img[:, :, 1] *= g_mult
-        img[:, :, 2] *= b_mult
-
-    # 1. Exposure (2^stops)
-    if exposure != 0.0:
-        img *= 2**exposure
+    if _can_gpu_tone_map(img):
+        out, stats = _gpu_tone_map(
+            img,
+            calculate_stats,
+            out,
+            exposure=exposure,
+            contrast=contrast,
+            blacks=blacks,
+            whites=whites,
+            shadows=shadows,
+            highlights=highlights,
+            saturation=saturation,
+            temperature=temperature,
+            tint=tint,
+        )
+        elapsed = (time.perf_counter() - start_time) * 1000
+        logger.debug(f"Tone Map: (CUDA) | Time: {elapsed:.2f}ms")
+        return out, stats
+
+    if _can_fuse_tone_map(img):
+        if out is None:
+            out = np.empty_like(img)
+        clipped_shadows, clipped_highlights, total = _fused_tone_map(
+            img,
+            out,
+            exposure=exposure,
+            contrast=contrast,
+            blacks=blacks,
+            whites=whites,
+            shadows=shadows,
+            highlights=highlights,
+            saturation=saturation,
+            temperature=temperature,
+            tint=tint,
+            with_stats=calculate_stats,
+        )
+        stats = {}
+        if calculate_stats:
+            stats = {
+                "pct_shadows_clipped": clipped_shadows / total_pixels * 100,
+                "pct_highlights_clipped": clipped_highlights / total_pixels * 100,
+                "mean": total / total_pixels,
+            }
 
-    # 1.5 Contrast (Symmetric around 0.5)
-    if contrast != 1.0:
-        img -= 0.5
-        img *= contrast
-        img += 0.5
+        elapsed = (time.perf_counter() - start_time) * 1000
+        logger.debug(f"Tone Map: (Fused) | Time: {elapsed:.2f}ms")
+        return out, stats
 
-    # 2. Tone EQ (Blacks, Whites, Shadows & Highlights) and 3. Saturation
-    # We calculate luminance once and reuse it.
-    # IMPORTANT: We use unclipped luminance to allow for highlight recovery of >1.0 values.
     if (
-        blacks != 0.0
-        or whites != 1.0
-        or shadows != 0.0
-        or highlights != 0.0
-        or saturation != 1.0
+        exposure == 0.0
+        and contrast == 1.0
+        and blacks == 0.0
+        and whites == 1.0
+        and shadows == 0.0
+        and highlights == 0.0
+        and saturation == 1.0
+        and temperature == 0.0
+        and tint == 0.0
     ):
-        # Calculate luminance (Rec. 709)
-        lum = 0.2126 * img[:, :, 0] + 0.7152 * img[:, :, 1] + 0.0722 * img[:, :, 2]
-        lum_3d = lum[:, :, np.newaxis]
-
-        # 2.1 Blacks (Linear Offset/Crush)
-        if blacks != 0.0:
-            img -= blacks
-
-        # 2.2 Whites (Linear Level Adjustment)
-        if whites != 1.0:
-            denom = whites - blacks
-            if abs(denom) < 1e-6:
-                denom = 1e-6
-            img /= denom
-
-        # 2.3 Shadows & Highlights
-        if shadows != 0.0:
-            s_mask = (1.0 - np.clip(lum_3d, 0, 1)) ** 2
-            img *= 1.0 + shadows * s_mask
-
-        if highlights != 0.0:
-            if highlights < 0:
-                # RECOVERY: Compress over-exposed highlights
-                # Use unclipped luminance for the mask to distinguish clipped areas
-                h_mask = np.maximum(lum_3d, 0) ** 2
-                img /= 1.0 + abs(highlights) * h_mask
-            else:
-                # BOOST: Brighten highlights
-                h_mask = np.clip(lum_3d, 0, 1) ** 2
-                h_term = highlights * h_mask
-                # Use a blend that caps at 1.0
-                img = img * (1.0 - h_term) + h_term
-
-        if saturation != 1.0:
-            # Re-calculate luminance after tone adjustments for accurate saturation
-            # Use clipped luminance for saturation to avoid color shifts in over-exposed areas
-            curr_lum = (
-                0.2126 * img[:, :, 0] + 0.7152 * img[:, :, 1] + 0.0722 * img[:, :, 2]
-            )
-            np.clip(curr_lum, 0, 1, out=curr_lum)
-            curr_lum_3d = curr_lum[:, :, np.newaxis]
+        # Identity settings (e.g. sliders at their defaults): a single clip
+        # into a new array replaces the copy and the in-place final clip
+        stats = _clip_stats(img, total_pixels) if calculate_stats else {}
+        elapsed = (time.perf_counter() - start_time) * 1000
+        logger.debug(f"Tone Map: (Identity) | Time: {elapsed:.2f}ms")
+        return np.clip(img, 0.0, 1.0, out=out), stats
+
+    # 0. White Balance (Relative Scaling), 1. Exposure (2^stops),
+    # 1.5 Contrast (Symmetric around 0.5) and 2.1-2.2 Levels (Blacks & Whites)
+    # compose into one per-channel affine map, gain_c * x + bias. The gains
+    # are applied while copying into the output, which protects the input.
+    level_scale = _level_scale(blacks, whites)
+    gain = 2**exposure * contrast * level_scale
+    bias = (0.5 - 0.5 * contrast - blacks) * level_scale
+    if temperature != 0.0 or tint != 0.0:
+        # Per-channel gains as a diagonal 3x3 matmul: one BLAS call over the
+        # contiguous pixels, ~2.5x faster than three strided channel multiplies
+        # (and a (3,)-broadcast multiply, whose inner loop is only 3 long)
+        wb_gain = np.diag(np.multiply(_wb_multipliers(temperature, tint), gain))
+        img = np.matmul(img, wb_gain.astype(img.dtype), out=out)
+    else:
+        img = np.multiply(img, gain, out=out)
+    if bias != 0.0:
+        img += bias
 
-            img -= curr_lum_3d
-            img *= saturation
-            img += curr_lum_3d
+    # 2.3 Shadows & Highlights
+    # IMPORTANT: We use unclipped luminance to allow for highlight recovery of >1.0 values.
+    if shadows != 0.0 or highlights != 0.0:
+        img, curr_lum = _apply_tone_eq_numpy(
+            img, blacks, level_scale, shadows, highlights, track_lum=saturation != 1.0
+        )
+    else:
+        curr_lum = None
+
+    # 3. Saturation
+    if saturation != 1.0:
+        # Luminance after tone adjustments for accurate saturation, reusing the
+        # one tracked through the Tone EQ when available
+        # Use clipped luminance for saturation to avoid color shifts in over-exposed areas
+        if curr_lum is None:
+            curr_lum = _luminance(img)
+        np.clip(curr_lum, 0, 1, out=curr_lum)
+        curr_lum_3d = curr_lum[:, :, np.newaxis]
+
+        img -= curr_lum_3d
+        img *= saturation
+        img += curr_lum_3d
 
     # Stats and Clipping
-    if calculate_stats:
-        clipped_shadows = np.sum(img < 0.0)
-        clipped_highlights = np.sum(img > 1.0)
-        stats = {
-            "pct_shadows_clipped": clipped_shadows / total_pixels * 100,
-            "pct_highlights_clipped": clipped_highlights / total_pixels * 100,
-            "mean": img.mean(),
-        }
-    else:
-        stats = {}
+    stats = _clip_stats(img, total_pixels) if calculate_stats else {}
 
     # Final Clip in-place
     np.clip(img, 0.0, 1.0, out=img)
@@ -193,13 +718,122 @@ def apply_tone_map(
     return img, stats
 
 
+def _tone_map_kwargs(settings):
+    """The apply_tone_map keyword arguments stored in an edit settings dict."""
+    return {
+        "temperature": settings.get("temperature", 0.0),
+        "tint": settings.get("tint", 0.0),
+        "exposure": settings.get("exposure", 0.0),
+        "contrast": settings.get("contrast", 1.0),
+        "blacks": settings.get("blacks", 0.0),
+        "whites": settings.get("whites", 1.0),
+        "shadows": settings.get("shadows", 0.0),
+        "highlights": settings.get("highlights", 0.0),
+        "saturation": settings.get("saturation", 1.0),
+    }
+
+
+def process_to_uint8(img, settings, out=None):
+    """
+    Tone maps a float image with the given edit settings and returns uint8 pixels.
+    With Numba the fused kernel writes the pixels straight into the (optionally
+    caller-provided) output buffer, so no float result is ever allocated;
+    otherwise the float result is released before returning.
+    """
+    if out is None:
+        out = np.empty(img.shape, dtype=np.uint8)
+    if _can_fuse_tone_map(img):
+        _fused_tone_map(img, out, **_tone_map_kwargs(settings), with_stats=False)
+        return out
+    tone, _ = apply_tone_map(img, **_tone_map_kwargs(settings), calculate_stats=False)
+    return float_to_uint8(tone, out=out)
+
+
+def process_to_uint16(img, settings, out=None):
+    """Like process_to_uint8, but returns uint16 pixels for high bit-depth export."""
+    if out is None:
+        out = np.empty(img.shape, dtype=np.uint16)
+    if _can_fuse_tone_map(img):
+        _fused_tone_map(img, out, **_tone_map_kwargs(settings), with_stats=False)
+        return out
+    tone, _ = apply_tone_map(img, **_tone_map_kwargs(settings), calculate_stats=False)
+    return float_to_uint16(tone, out=out)
+
+
+def is_tone_lut_compatible(shadows=0.0, highlights=0.0, saturation=1.0):
+    """
+    Returns True when the tone map reduces to an independent 1D curve per channel.
+    Shadows, Highlights and Saturation depend on pixel luminance, so they can't
+    be expressed as a per-channel lookup table.
+    """
+    return shadows == 0.0 and highlights == 0.0 and saturation == 1.0
+
+
+def build_tone_lut(
+    exposure=0.0,
+    contrast=1.0,
+    blacks=0.0,
+    whites=1.0,
+    temperature=0.0,
+    tint=0.0,
+):
+    """
+    Builds a 256-entry per-channel uint8 LUT (shape (1, 256, 3)) for the
+    per-channel stages of apply_tone_map (White Balance, Exposure, Contrast, Levels).
+    """
+    ramp = np.arange(256, dtype=np.float32) / 255.0
+    ramp = np.repeat(ramp, 3).reshape(1, 256, 3)
+    curve, _ = apply_tone_map(
+        ramp,
+        exposure=exposure,
+        contrast=contrast,
+        blacks=blacks,
+        whites=whites,
+        temperature=temperature,
+        tint=tint,
+        calculate_stats=False,
+    )
+    return float_to_uint8(curve)
+
+
+def apply_tone_lut(img, lut, out=None):
+    """
+    Applies a LUT from build_tone_lut to an HxWx3 uint8 image.
+    If out is given (same shape, uint8), the result is written into it.
+    """
+    if cv2 is not None:
+        return cv2.LUT(img, lut, dst=out)
+    if out is None:
+        out = np.empty_like(img)
+    # One 1D gather per channel; mode="clip" lets np.take write straight into
+    # the strided output instead of buffering (uint8 indices are always valid)
+    for c in range(3):
+        np.take(lut[0, :, c], img[:, :, c], out=out[:, :, c], mode="clip")
+    return out
+
+
+# Pixels sampled by calculate_auto_exposure and calculate_auto_wb
+AUTO_EXPOSURE_SAMPLES = 250_000
+
+
+def _auto_sample(img):
+    """
+    Strided view of ~AUTO_EXPOSURE_SAMPLES evenly spread pixels. Percentiles
+    and channel means of the sample match the full image to well within a
+    slider step, at a fraction of the memory traffic.
+    """
+    h, w = img.shape[:2]
+    step = max(1, int(math.sqrt(h * w / AUTO_EXPOSURE_SAMPLES)))
+    return img[::step, ::step]
+
+
 def calculate_auto_exposure(img):
     """
     Analyzes image histogram to determine auto-exposure and contrast settings.
     Returns a dict with recommended {exposure, blacks, whites}.
     """
-    # 1. Calculate luminance
-    lum = 0.2126 * img[:, :, 0] + 0.7152 * img[:, :, 1] + 0.0722 * img[:, :, 2]
+    # 1. Calculate luminance on a strided sample of the image
+    lum = _luminance(_auto_sample(img))
 
     # Target: 98th percentile should be at ~0.85 (bright but not clipped)
     # This works well for linear RAW data.
@@ -229,10 +863,11 @@ def calculate_auto_wb(img):
     """
     Calculates relative temperature and tint to neutralize the image (Gray World).
     """
-    # Calculate channel means
-    r_avg = np.mean(img[:, :, 0])
-    g_avg = np.mean(img[:, :, 1])
-    b_avg = np.mean(img[:, :, 2])
+    # Calculate channel means on a strided sample of the image
+    sample = _auto_sample(img)
+    r_avg = np.mean(sample[:, :, 0])
+    g_avg = np.mean(sample[:, :, 1])
+    b_avg = np.mean(sample[:, :, 2])
 
     # Avoid division by zero
     if r_avg < 1e-6:
@@ -261,16 +896,56 @@ def calculate_auto_wb(img):
     # temp * 0.8 = log(b/r)
     # tint * 0.6 = log(r*b / g^2)
 
-    temp = np.log(b_avg / r_avg) / 0.8
-    tint = np.log((r_avg * b_avg) / (g_avg**2)) / 0.6
+    temp = math.log(b_avg / r_avg) / 0.8
+    tint = math.log((r_avg * b_avg) / (g_avg**2)) / 0.6
 
     # Clamp to slider range
     return {
-        "temperature": float(np.clip(temp, -1.0, 1.0)),
-        "tint": float(np.clip(tint, -1.0, 1.0)),
+        "temperature": min(max(temp, -1.0), 1.0),
+        "tint": min(max(tint, -1.0), 1.0),
     }
 
 
+def _rotate_expand_cv2(pil_img, angle, flip_h=False, flip_v=False):
+    """
+    Bicubic rotation with OpenCV's vectorised warpAffine.
+    Produces the same canvas size and alignment as
+    Image.rotate(angle, resample=BICUBIC, expand=True).
+    Flips to apply before the rotation are folded into the same warp.
+    """
+    w, h = pil_img.size
+    rad = math.radians(angle)
+    cos_a = round(math.cos(rad), 15)
+    sin_a = round(math.sin(rad), 15)
+
+    # Expanded canvas, computed from the rotated corners as PIL does
+    corners = ((-w / 2, -h / 2), (w / 2, -h / 2), (w / 2, h / 2), (-w / 2, h / 2))
+    xs = [x * cos_a + y * sin_a for x, y in corners]
+    ys = [y * cos_a - x * sin_a for x, y in corners]
+    new_w = math.ceil(max(xs)) - math.floor(min(xs))
+    new_h = math.ceil(max(ys)) - math.floor(min(ys))
+
+    matrix = cv2.getRotationMatrix2D(((w - 1) / 2, (h - 1) / 2), angle, 1.0)
+    matrix[0, 2] += (new_w - w) / 2
+    matrix[1, 2] += (new_h - h) / 2
+    # Mirroring x -> (w - 1) - x first is the same as negating the x column
+    # and shifting by (w - 1) times it; likewise for y
+    if flip_h:
+        matrix[:, 2] += matrix[:, 0] * (w - 1)
+        matrix[:, 0] *= -1
+    if flip_v:
+        matrix[:, 2] += matrix[:, 1] * (h - 1)
+        matrix[:, 1] *= -1
+    rotated = cv2.warpAffine(
+        np.asarray(pil_img),
+        matrix,
+        (new_w, new_h),
+        flags=cv2.INTER_CUBIC,
+        borderMode=cv2.BORDER_CONSTANT,
+    )
+    return Image.fromarray(rotated)
+
+
 def apply_geometry(pil_img, rotate=0.0, crop=None, flip_h=False, flip_v=False):
     """
     Applies geometric transformations: Flip -> Rotation -> Crop.
@@ -283,18 +958,26 @@ def apply_geometry(pil_img, rotate=0.0, crop=None, flip_h=False, flip_v=False):
         flip_h: bool, mirror horizontally
         flip_v: bool, mirror vertically
     """
+    # With OpenCV, the flips are folded into the rotation's warp instead of
+    # transposing the full image first
+    fuse_flips = rotate != 0.0 and cv2 is not None and pil_img.mode in ("L", "RGB")
+
     # 0. Apply Flip
-    if flip_h:
-        pil_img = pil_img.transpose(Image.FLIP_LEFT_RIGHT)
-    if flip_v:
-        pil_img = pil_img.transpose(Image.FLIP_TOP_BOTTOM)
+    if not fuse_flips:
+        if flip_h:
+            pil_img = pil_img.transpose(Image.FLIP_LEFT_RIGHT)
+        if flip_v:
+            pil_img = pil_img.transpose(Image.FLIP_TOP_BOTTOM)
 
     # 1. Apply Rotation
     if rotate != 0.0:
         # expand=True changes the image size to fit the rotated image
         # PIL rotates CCW by default. The user wants negative to be CW, so
         # positive is CCW. This matches PIL's behavior.
-        pil_img = pil_img.rotate(rotate, resample=Image.BICUBIC, expand=True)
+        if fuse_flips:
+            pil_img = _rotate_expand_cv2(pil_img, rotate, flip_h, flip_v)
+        else:
+            pil_img = pil_img.rotate(rotate, resample=Image.BICUBIC, expand=True)
 
     # 2. Apply Crop
     if crop is not None:
@@ -378,30 +1061,189 @@ def calculate_max_safe_crop(w, h, angle_deg, aspect_ratio=None):
     )
 
 
-@lru_cache(maxsize=4)
-def open_raw(path, half_size=False, output_bps=8):
+class _BytesLRU:
     """
-    Opens a RAW or standard image file.
-    Args:
-        path: File path (str or Path)
-        half_size: If True, decodes at 1/2 resolution (1/4 pixels) for speed.
-        output_bps: Bit depth of the output image (8 or 16).
+    Thread-safe LRU cache of NumPy arrays bounded by their total size in bytes.
+    Values are (array, extra) pairs; only the array counts towards the budget.
     """
-    path = Path(path)
+
+    def __init__(self, cap_bytes):
+        self.cap_bytes = cap_bytes
+        self.cur_bytes = 0
+        self._entries = OrderedDict()
+        self._lock = threading.Lock()
+
+    def get(self, key):
+        with self._lock:
+            value = self._entries.get(key)
+            if value is not None:
+                self._entries.move_to_end(key)
+            return value
+
+    def put(self, key, arr, extra=None):
+        nbytes = arr.nbytes
+        if nbytes > self.cap_bytes:
+            return
+        with self._lock:
+            old = self._entries.pop(key, None)
+            if old is not None:
+                self.cur_bytes -= old[0].nbytes
+            self._entries[key] = (arr, extra)
+            self.cur_bytes += nbytes
+            while self.cur_bytes > self.cap_bytes:
+                _, (evicted, _) = self._entries.popitem(last=False)
+                self.cur_bytes -= evicted.nbytes
+
+    def clear(self):
+        with self._lock:
+            self._entries.clear()
+            self.cur_bytes = 0
+
+
+# Decoded integer pixels, keyed on the file's mtime so edits on disk are seen.
+# Storing uint8/uint16 instead of float32 fits 2-4x more images in the budget.
+_OPEN_RAW_CACHE = _BytesLRU(512 * 1024 * 1024)
+
+
+@contextmanager
+def _sequential_read(path):
+    """
+    Opens a RAW that is about to be read front to back and hints the kernel
+    to use sequential read-ahead for it. Read-ahead state belongs to the open
+    file, so the yielded file object itself must be handed to the reader.
+    The hint is skipped where posix_fadvise is unavailable.
+    """
+    with open(path, "rb") as f:
+        if hasattr(os, "posix_fadvise"):
+            os.posix_fadvise(f.fileno(), 0, 0, os.POSIX_FADV_SEQUENTIAL)
+        yield f
+
+
+# Unpacked LibRaw handles of the most recently decoded RAWs. postprocess can
+# run repeatedly on one handle, so decoding the same file again at another
+# size or bit depth skips reading and unpacking it. A handle holds the CFA
+# data, LibRaw's working buffers and the file's bytes, so only the last file
+# is kept. Handles are reference counted: one evicted while a decode is still
+# using it is closed by that decode, so concurrent decodes never wait on each
+# other and each keeps its own handle.
+RAW_HANDLE_CACHE_SIZE = 1
+_RAW_HANDLES = OrderedDict()
+_RAW_HANDLES_LOCK = threading.Lock()
+
+
+class _RawHandle:
+    """An unpacked rawpy handle shared by the cache and the decodes using it."""
+
+    def __init__(self, raw):
+        self.raw = raw
+        # One LibRaw handle can't postprocess on two threads at once
+        self.lock = threading.Lock()
+        self.users = 0
+        self.cached = True
+
+
+def _read_unpacked(path_str):
+    """Opens and unpacks a RAW, closing the handle again if unpacking fails."""
+    # LibRaw reads the whole file from the advised descriptor in one pass
+    with _sequential_read(path_str) as f:
+        raw = rawpy.imread(f)
+        try:
+            raw.unpack()
+        except Exception:
+            raw.close()
+            raise
+    return raw
+
+
+def _uncache_raw_handles(handles):
+    """Marks handles as dropped from the cache; returns those no decode is using.
+
+    Must be called with _RAW_HANDLES_LOCK held.
+    """
+    idle = []
+    for handle in handles:
+        handle.cached = False
+        if handle.users == 0:
+            idle.append(handle)
+    return idle
+
+
+@contextmanager
+def _unpacked_raw(path):
+    """Yields an unpacked rawpy handle for path, used by one thread at a time."""
+    path_str = str(path)
+    key = (path_str, path.stat().st_mtime_ns)
+
+    with _RAW_HANDLES_LOCK:
+        handle = _RAW_HANDLES.get(key)
+        if handle is not None:
+            _RAW_HANDLES.move_to_end(key)
+            handle.users += 1
+
+    if handle is None:
+        handle = _RawHandle(_read_unpacked(path_str))
+        handle.users = 1
+        with _RAW_HANDLES_LOCK:
+            dropped = [_RAW_HANDLES.pop(key)] if key in _RAW_HANDLES else []
+            _RAW_HANDLES[key] = handle
+            while len(_RAW_HANDLES) > RAW_HANDLE_CACHE_SIZE:
+                dropped.append(_RAW_HANDLES.popitem(last=False)[1])
+            idle = _uncache_raw_handles(dropped)
+        for stale in idle:
+            stale.raw.close()
+
+    try:
+        with handle.lock:
+            yield handle.raw
+    finally:
+        with _RAW_HANDLES_LOCK:
+            handle.users -= 1
+            close = not handle.cached and handle.users == 0
+        if close:
+            handle.raw.close()
+
+
+# Formats decoded with OpenCV at full size; half size JPEGs use Pillow's
+# reduced-scale draft decode, which is as fast
+_CV2_DECODE_EXTS = {".jpg", ".jpeg"}
+
+
+def _decode_image(path, half_size, output_bps):
+    """Decodes a RAW or standard image to integer RGB. Returns (rgb, max_value)."""
     ext = path.suffix.lower()
 
     if ext in STD_EXTS:
+        if not half_size and cv2 is not None and ext in _CV2_DECODE_EXTS:
+            # libjpeg-turbo through OpenCV straight into one contiguous array,
+            # about 2x faster than Pillow; EXIF orientation is applied too
+            bgr = cv2.imread(str(path), cv2.IMREAD_COLOR)
+            if bgr is not None:
+                return cv2.cvtColor(bgr, cv2.COLOR_BGR2RGB, dst=bgr), 255.0
+
         with Image.open(path) as img:
+            if half_size:
+                # Let libjpeg decode straight at reduced scale (no-op for other formats)
+                half_long_side = max(img.size) // 2
+                img.draft("RGB", (img.width // 2, img.height // 2))
             img = ImageOps.exif_transpose(img)
             if img.mode != "RGB":
                 img = img.convert("RGB")
-            if half_size:
-                img.thumbnail((img.width // 2, img.height // 2))
-            rgb = np.array(img)
-            return rgb.astype(np.float32) / 255.0
-
-    path_str = str(path)
-    with rawpy.imread(path_str) as raw:
+            if half_size and max(img.size) > half_long_side:
+                if cv2 is None:
+                    img.thumbnail((half_long_side, half_long_side))
+                else:
+                    # Area averaging is the exact box filter for a 2x reduction
+                    scale = half_long_side / max(img.size)
+                    target = (
+                        max(1, round(img.width * scale)),
+                        max(1, round(img.height * scale)),
+                    )
+                    return cv2.resize(
+                        np.asarray(img), target, interpolation=cv2.INTER_AREA
+                    ), 255.0
+            return np.array(img), 255.0
+
+    with _unpacked_raw(path) as raw:
         rgb = raw.postprocess(
             use_camera_wb=True,
             half_size=half_size,
@@ -409,17 +1251,137 @@ def open_raw(path, half_size=False, output_bps=8):
             bright=1.0,
             output_bps=output_bps,
         )
+    return rgb, 65535.0 if output_bps == 16 else 255.0
+
+
+def open_raw(path, half_size=False, output_bps=8):
+    """
+    Opens a RAW or standard image file.
+    Recently decoded files are served from a size-bounded cache, keyed on the
+    resolved path and invalidated when the file's modification time changes.
+    Args:
+        path: File path (str or Path)
+        half_size: If True, decodes at 1/2 resolution (1/4 pixels) for speed.
+        output_bps: Bit depth of the output image (8 or 16).
+    """
+    path = Path(path).resolve()
+    key = (str(path), path.stat().st_mtime_ns, half_size, output_bps)
+
+    cached = _OPEN_RAW_CACHE.get(key)
+    if cached is None:
+        rgb, max_value = _decode_image(path, half_size, output_bps)
+        _OPEN_RAW_CACHE.put(key, rgb, max_value)
+    else:
+        rgb, max_value = cached
 
     # Normalize to 0.0-1.0 range
-    if output_bps == 16:
-        return rgb.astype(np.float32) / 65535.0
-    return rgb.astype(np.float32) / 255.0
+    return uint_to_float(rgb, max_value)
+
+
+def _clear_open_raw_caches():
+    """Drops every cached decode and LibRaw handle."""
+    _OPEN_RAW_CACHE.clear()
+    with _RAW_HANDLES_LOCK:
+        idle = _uncache_raw_handles(_RAW_HANDLES.values())
+        _RAW_HANDLES.clear()
+    for handle in idle:
+        handle.raw.close()
+
+
+# open_raw used to be wrapped in functools.lru_cache; keep its cache_clear()
+open_raw.cache_clear = _clear_open_raw_caches
+
+
+def open_raw_many(paths, half_size=False, output_bps=8):
+    """
+    Opens several RAW or standard image files concurrently.
+    LibRaw's demosaic and Pillow's decoders release the GIL, so decoding on
+    a thread pool overlaps the files across cores.
+    Returns the images in the same order as paths.
+    """
+    futures = [
+        _OPEN_RAW_POOL.submit(open_raw, path, half_size, output_bps) for path in paths
+    ]
+    return [future.result() for future in futures]
+
+
+# How much of a RAW file to scan for embedded JPEG previews
+PREVIEW_SCAN_BYTES = 4 * 1024 * 1024
+_MAX_PREVIEW_CANDIDATES = 16
+
 
+def _jpeg_dimensions(buf, start):
+    """
+    Reads (width, height) from the frame header of a JPEG starting at
+    buf[start], walking its marker segments in place. Returns None if no
+    frame header follows, as for SOI-like bytes inside compressed data.
+    """
+    pos = start + 2
+    while pos + 4 <= len(buf):
+        if buf[pos] != 0xFF:
+            return None
+        marker = buf[pos + 1]
+        if marker == 0xFF:  # Fill byte
+            pos += 1
+            continue
+        if marker == 0x01 or 0xD0 <= marker <= 0xD7:  # No payload
+            pos += 2
+            continue
+        if 0xC0 <= marker <= 0xCF and marker not in (0xC4, 0xC8, 0xCC):
+            if pos + 9 > len(buf):
+                return None
+            height, width = struct.unpack_from(">HH", buf, pos + 5)
+            return width, height
+        (length,) = struct.unpack_from(">H", buf, pos + 2)
+        if marker == 0xDA or length < 2:  # Scan data before any frame header
+            return None
+        pos += 2 + length
+    return None
+
+
+def _fast_jpeg_preview(path, size):
+    """
+    Finds an embedded JPEG preview of at least size x size by scanning the
+    start of a RAW file for JPEG SOI markers, without opening it in LibRaw.
+    Picks the smallest preview that still covers size. Returns a loaded PIL
+    Image, or None if no suitable preview lies within the scanned bytes.
+    """
+    with open(path, "rb") as f:
+        buf = f.read(PREVIEW_SCAN_BYTES)
+
+    # Candidate headers are read in place; only the chosen one is decoded
+    candidates = []
+    start = buf.find(b"\xff\xd8\xff")
+    for _ in range(_MAX_PREVIEW_CANDIDATES):
+        if start < 0:
+            break
+        dims = _jpeg_dimensions(buf, start)
+        if dims is not None and min(dims) > 0 and max(dims) >= size:
+            candidates.append((max(dims), start))
+        start = buf.find(b"\xff\xd8\xff", start + 3)
+
+    view = memoryview(buf)
+    for _, start in sorted(candidates):
+        try:
+            img = Image.open(BytesIO(view[start:]))
+            if img.format != "JPEG":
+                continue
+            img.draft("RGB", (size, size))
+            img.load()  # Fails if the preview runs past the scanned bytes
+            return img
+        except Exception:
+            continue
+    return None
 
-def extract_thumbnail(path):
+
+def extract_thumbnail(path, size=None):
     """
     Attempts to extract an embedded thumbnail.
     Falls back to a fast, half-size RAW conversion if no thumbnail exists.
+    If size is given, JPEG sources are decoded at the smallest DCT scale that
+    still covers size x size, which is much faster than a full decode, and
+    RAW files are first scanned for an embedded preview of that size so
+    LibRaw is not opened at all.
     Returns a PIL Image or None on failure.
     """
     path = Path(path)
@@ -428,6 +1390,8 @@ def extract_thumbnail(path):
     if ext in STD_EXTS:
         try:
             img = Image.open(path)
+            if size:
+                img.draft("RGB", (size, size))
             img = ImageOps.exif_transpose(img)
             if img.mode != "RGB":
                 img = img.convert("RGB")
@@ -436,6 +1400,14 @@ def extract_thumbnail(path):
             logger.error(f"Error opening standard image thumbnail for {path}: {e}")
             return None
 
+    if size:
+        try:
+            img = _fast_jpeg_preview(path, size)
+            if img is not None:
+                return ImageOps.exif_transpose(img)
+        except Exception as e:
+            logger.debug(f"Fast preview scan failed for {path}: {e}")
+
     path_str = str(path)
     try:
         with rawpy.imread(path_str) as raw:
@@ -447,6 +1419,8 @@ def extract_thumbnail(path):
             # If we found a JPEG thumbnail
             if thumb and thumb.format == rawpy.ThumbFormat.JPEG:
                 img = Image.open(BytesIO(thumb.data))
+                if size:
+                    img.draft("RGB", (size, size))
                 return ImageOps.exif_transpose(img)
 
             # Fallback: fast postprocess (half_size=True is very fast)
@@ -463,21 +1437,77 @@ def extract_thumbnail(path):
         return None
 
 
-def sharpen_image(img, radius, percent, method="High Quality"):
-    """Advanced sharpening with support for both PIL and Numpy float32."""
+# Blur and edge mask of the last array sharpened. Dragging the amount slider
+# re-sharpens the same cached stage output, so only the final blend reruns.
+# Identity alone can't tell an array mutated in place from the original, so
+# reuse also needs the caller's cache_key, which must change with the pixels.
+# The input itself is held so identity checks can't match a recycled buffer.
+_SHARPEN_MAPS = {
+    "img": None,
+    "key": None,
+    "radius": None,
+    "blur": None,
+    "edges": None,
+}
+_SHARPEN_MAPS_LOCK = threading.Lock()
+
+
+def _sharpen_maps(img_float, radius, cache_key=None):
+    """Returns the unsharp blur and dilated Canny edge mask for img_float."""
+    cache = cache_key is not None
+    with _SHARPEN_MAPS_LOCK:
+        if (
+            cache
+            and _SHARPEN_MAPS["img"] is img_float
+            and _SHARPEN_MAPS["key"] == cache_key
+        ):
+            edges = _SHARPEN_MAPS["edges"]
+            blur = _SHARPEN_MAPS["blur"] if _SHARPEN_MAPS["radius"] == radius else None
+        else:
+            blur = edges = None
+
+    if blur is None:
+        blur = cv2.GaussianBlur(img_float, (0, 0), radius)
+    if edges is None:
+        # Edge-aware threshold (Canny needs uint8)
+        gray = cv2.cvtColor(float_to_uint8(img_float), cv2.COLOR_RGB2GRAY)
+        edges = cv2.Canny(gray, 50, 150)
+
+        # Dilate edges slightly
+        kernel = np.ones((3, 3), np.uint8)
+        edges = cv2.dilate(edges, kernel, iterations=1)
+
+    if cache:
+        with _SHARPEN_MAPS_LOCK:
+            _SHARPEN_MAPS.update(
+                img=img_float, key=cache_key, radius=radius, blur=blur, edges=edges
+            )
+    return blur, edges
+
+
+# Pillow's UnsharpMask default: differences up to this many levels are kept
+PIL_UNSHARP_THRESHOLD = 3
+
+
+def sharpen_image(img, radius, percent, method="High Quality", cache_key=None):
+    """Advanced sharpening with support for both PIL and Numpy float32.
+
+    Passing a hashable cache_key that identifies the pixels of img lets a
+    re-sharpen of the same array reuse its blur and edge mask.
+    """
     start_time = time.perf_counter()
     if isinstance(img, Image.Image):
         # Convert PIL to RGB if needed
         if img.mode != "RGB":
             img = img.convert("RGB")
         img_array = np.array(img)
-        img_float = img_array.astype(np.float32) / 255.0
+        img_float = uint_to_float(img_array)
         was_pil = True
     else:
         # Assume Numpy array
         img_float = img
         if img_float.dtype != np.float32:
-            img_float = img_float.astype(np.float32) / 255.0
+            img_float = uint_to_float(img_float)
         was_pil = False
 
     if method == "High Quality":
@@ -485,26 +1515,30 @@ def sharpen_image(img, radius, percent, method="High Quality"):
             if cv2 is None:
                 raise ImportError("OpenCV not available")
 
-            # Create unsharp mask
-            blur = cv2.GaussianBlur(img_float, (0, 0), radius)
-            sharpened = img_float + (img_float - blur) * (percent / 100.0)
-
-            # Edge-aware threshold (Canny needs uint8)
-            gray = cv2.cvtColor((img_float * 255).astype(np.uint8), cv2.COLOR_RGB2GRAY)
-            edges = cv2.Canny(gray, 50, 150)
-
-            # Dilate edges slightly
-            kernel = np.ones((3, 3), np.uint8)
-            edges = cv2.dilate(edges, kernel, iterations=1)
+            # Blur and edge mask; PIL inputs are fresh copies, never worth caching
+            blur, edges = _sharpen_maps(
+                img_float, radius, cache_key=None if was_pil else cache_key
+            )
 
             # Combine: Sharpened edges, keep original for flat areas
-            result = np.where(edges[:, :, np.newaxis] > 0, sharpened, img_float)
+            if NUMBA_AVAILABLE and img_float.ndim == 3:
+                result = np.empty_like(img_float)
+                # Parallel kernel; exports sharpen from several threads at once
+                with _NUMBA_LOCK:
+                    _unsharp_blend_kernel(
+                        img_float, blur, edges, percent / 100.0, result
+                    )
+            else:
+                # One SIMD multiply-add: (1 + a) * img - a * blur
+                amount = percent / 100.0
+                sharpened = cv2.addWeighted(img_float, 1.0 + amount, blur, -amount, 0)
+                result = np.where(edges[:, :, np.newaxis] > 0, sharpened, img_float)
+                np.clip(result, 0, 1.0, out=result)
 
             if was_pil:
-                result_array = np.clip(result * 255, 0, 255).astype(np.uint8)
-                res = Image.fromarray(result_array)
+                res = Image.fromarray(float_to_uint8(result))
             else:
-                res = np.clip(result, 0, 1.0)
+                res = result
 
             elapsed = (time.perf_counter() - start_time) * 1000
             logger.debug(
@@ -514,10 +1548,24 @@ def sharpen_image(img, radius, percent, method="High Quality"):
         except Exception as e:
             logger.error(f"High Quality Sharpen failed: {e}")
 
-    # Fallback for PIL
+    # Fallback for PIL: OpenCV's unsharp mask is SIMD and multi-threaded,
+    # Pillow's UnsharpMask is only used when OpenCV is unavailable
     if was_pil:
+        if cv2 is not None and radius > 0:
+            amount = percent / 100.0
+            blur = cv2.GaussianBlur(img_array, (0, 0), float(radius))
+            sharpened = cv2.addWeighted(img_array, 1.0 + amount, blur, -amount, 0)
+            # Like Pillow's UnsharpMask (threshold=3), leave low-contrast
+            # detail alone so flat areas don't pick up amplified noise
+            flat = cv2.absdiff(img_array, blur) <= PIL_UNSHARP_THRESHOLD
+            np.copyto(sharpened, img_array, where=flat)
+            return Image.fromarray(sharpened)
         return img.filter(
-            ImageFilter.UnsharpMask(radius=float(radius), percent=int(percent))
+            ImageFilter.UnsharpMask(
+                radius=float(radius),
+                percent=int(percent),
+                threshold=PIL_UNSHARP_THRESHOLD,
+            )
         )
 
     # Fallback for Numpy (Basic Unsharp Mask)
@@ -530,12 +1578,35 @@ def sharpen_image(img, radius, percent, method="High Quality"):
         if k_size % 2 == 0:
             k_size += 1
         blur = cv2.GaussianBlur(img_float, (k_size, k_size), radius)
-        result = img_float + (img_float - blur) * (percent / 100.0)
-        return np.clip(result, 0, 1.0)
+        amount = percent / 100.0
+        result = cv2.addWeighted(img_float, 1.0 + amount, blur, -amount, 0)
+        return np.clip(result, 0, 1.0, out=result)
     except Exception:
         return img_float
 
 
+# Chroma planes smaller than this are filtered at full resolution
+CHROMA_HALF_RES_MIN_SIDE = 64
+
+
+def _denoise_chroma(plane, sigma_color, sigma_space):
+    """
+    Edge-preserving blur of a chroma plane.
+    Chroma detail is invisible at full resolution (the 4:2:0 argument), so
+    large planes are filtered at half size with a proportionally smaller
+    window and upsampled again, about 8x cheaper than the d=11 full-size filter.
+    """
+    h, w = plane.shape
+    if min(h, w) < CHROMA_HALF_RES_MIN_SIDE:
+        return cv2.bilateralFilter(plane, 11, sigma_color, sigma_space)
+
+    small = cv2.resize(
+        plane, ((w + 1) // 2, (h + 1) // 2), interpolation=cv2.INTER_AREA
+    )
+    small = cv2.bilateralFilter(small, 7, sigma_color, sigma_space / 2.0)
+    return cv2.resize(small, (w, h), interpolation=cv2.INTER_LINEAR)
+
+
 def de_noise_image(img, strength, method="High Quality", zoom=None):
     """Advanced de-noising with support for both PIL and Numpy float32.
     Preserves float32 precision throughout the pipeline to avoid bit-depth artifacts.
@@ -543,7 +1614,7 @@ def de_noise_image(img, strength, method="High Quality", zoom=None):
     if isinstance(img, Image.Image):
         if img.mode != "RGB":
             img = img.convert("RGB")
-        img_array = np.array(img).astype(np.float32) / 255.0
+        img_array = uint_to_float(np.asarray(img))
         was_pil = True
     else:
         img_array = img
@@ -593,7 +1664,7 @@ def de_noise_image(img, strength, method="High Quality", zoom=None):
                     img_uint8, None, h, hColor, 7, 21
                 )
 
-            denoised = denoised_uint8.astype(np.float32) / 255.0
+            denoised = uint_to_float(denoised_uint8)
 
             elapsed = (time.perf_counter() - start_time) * 1000
             logger.debug(
@@ -610,12 +1681,8 @@ def de_noise_image(img, strength, method="High Quality", zoom=None):
             # Increased diameter and spatial reach to average over larger areas
             chroma_sigma_color = float(strength) * 4.5 * s_scale
             chroma_sigma_space = 2.0 + (float(strength) / 10.0)
-            u_denoised = cv2.bilateralFilter(
-                u, 11, chroma_sigma_color, chroma_sigma_space
-            )
-            v_denoised = cv2.bilateralFilter(
-                v, 11, chroma_sigma_color, chroma_sigma_space
-            )
+            u_denoised = _denoise_chroma(u, chroma_sigma_color, chroma_sigma_space)
+            v_denoised = _denoise_chroma(v, chroma_sigma_color, chroma_sigma_space)
 
             # Luma: Conservative to preserve fine texture/grain
             luma_sigma_color = float(strength) * 0.4 * s_scale
@@ -650,12 +1717,18 @@ def de_noise_image(img, strength, method="High Quality", zoom=None):
             size += 1
 
         fallback_start = time.perf_counter()
-        # Convert back to PIL for the filter
-        pil_img = Image.fromarray((np.clip(img_array, 0, 1) * 255).astype(np.uint8))
-        result = pil_img.filter(ImageFilter.MedianFilter(size=size))
+        img_uint8 = float_to_uint8(np.clip(img_array, 0, 1))
+        if cv2 is not None:
+            result = Image.fromarray(cv2.medianBlur(img_uint8, size))
+            backend = "OpenCV MedianBlur"
+        else:
+            # Convert back to PIL for the filter
+            pil_img = Image.fromarray(img_uint8)
+            result = pil_img.filter(ImageFilter.MedianFilter(size=size))
+            backend = "PIL MedianFilter"
         elapsed = (time.perf_counter() - fallback_start) * 1000
         logger.debug(
-            f"Denoise: Fallback (PIL MedianFilter) | Strength: {strength:.2f}{size_str}{zoom_str} | Time: {elapsed:.2f}ms"
+            f"Denoise: Fallback ({backend}) | Strength: {strength:.2f}{size_str}{zoom_str} | Time: {elapsed:.2f}ms"
         )
         return result
 
@@ -673,8 +1746,13 @@ def de_noise_image(img, strength, method="High Quality", zoom=None):
             size += 1
 
         fallback_start = time.perf_counter()
-        # medianBlur expects uint8 or float32. We can use float32.
-        denoised = cv2.medianBlur(img_array, size)
+        # medianBlur only supports float32 for 3x3 and 5x5 kernels;
+        # larger ones need uint8
+        if size <= 5:
+            denoised = cv2.medianBlur(img_array, size)
+        else:
+            img_uint8 = float_to_uint8(np.clip(img_array, 0, 1))
+            denoised = uint_to_float(cv2.medianBlur(img_uint8, size))
         elapsed = (time.perf_counter() - fallback_start) * 1000
         logger.debug(
             f"Denoise: Fallback (OpenCV MedianBlur) | Strength: {strength:.2f}{size_str}{zoom_str} | Time: {elapsed:.2f}ms"
@@ -696,7 +1774,7 @@ def de_haze_image(img, strength, zoom=None, fixed_atmospheric_light=None):
     if isinstance(img, Image.Image):
         if img.mode != "RGB":
             img = img.convert("RGB")
-        img_array = np.array(img).astype(np.float32) / 255.0
+        img_array = uint_to_float(np.asarray(img))
         was_pil = True
     else:
         img_array = img
@@ -734,7 +1812,7 @@ def de_haze_image(img, strength, zoom=None, fixed_atmospheric_light=None):
                     cv2.MORPH_RECT, (kernel_size, kernel_size)
                 )
                 u_dark = cv2.erode(u_dark, kernel)
-                dark_channel = u_dark.get().astype(np.float32) / 255.0
+                dark_channel = uint_to_float(u_dark.get())
                 backend = "UMat (OpenCL)"
             except Exception:
                 dark_channel = np.min(img_array, axis=2)
@@ -773,7 +1851,7 @@ def de_haze_image(img, strength, zoom=None, fixed_atmospheric_light=None):
                 cv2.min(u_norm_channels[0], u_norm_channels[1]), u_norm_channels[2]
             )
             u_dark_norm = cv2.erode(u_dark_norm, kernel)
-            dark_normalized = u_dark_norm.get().astype(np.float32) / 255.0
+            dark_normalized = uint_to_float(u_dark_norm.get())
         except Exception:
             dark_normalized = np.min(normalized_img, axis=2)
             dark_normalized = cv2.erode(dark_normalized, kernel)
@@ -817,11 +1895,28 @@ def de_haze_image(img, strength, zoom=None, fixed_atmospheric_light=None):
         return img, None
 
 
+def save_jpeg(pil_img, output_path, quality=95):
+    """
+    Saves an image as a 4:2:0 JPEG. Encodes with PyTurboJPEG (libjpeg-turbo's
+    SIMD encoder) when it is installed, otherwise with Pillow.
+    """
+    if _TURBOJPEG is not None and pil_img.mode == "RGB":
+        data = _TURBOJPEG.encode(
+            np.asarray(pil_img),
+            quality=quality,
+            pixel_format=TJPF_RGB,
+            jpeg_subsample=TJSAMP_420,
+        )
+        Path(output_path).write_bytes(data)
+    else:
+        pil_img.save(output_path, quality=quality)
+
+
 def save_image(pil_img, output_path, quality=95):
     output_path = Path(output_path)
     fmt = output_path.suffix.lower()
     if fmt in (".jpeg", ".jpg"):
-        pil_img.save(output_path, quality=quality)
+        save_jpeg(pil_img, output_path, quality=quality)
     elif fmt in (".heif", ".heic"):
         if not HEIF_SUPPORTED:
             raise RuntimeError("HEIF requested but pillow-heif not installed.")
@@ -834,6 +1929,8 @@ def save_image(pil_img, output_path, quality=95):
 SIDECAR_DIR = ".pyNegative"
 
 
+# Pure; library refreshes ask for the same files' sidecars over and over
+@lru_cache(maxsize=4096)
 def get_sidecar_path(raw_path: str | Path) -> Path:
     """
     Returns the Path object to the sidecar JSON file for a given RAW file.
@@ -861,8 +1958,53 @@ def save_sidecar(raw_path: str | Path, settings: dict) -> None:
         "settings": settings,
     }
 
-    with open(sidecar_path, "w") as f:
-        json.dump(data, f, indent=4)
+    # Encode fully before touching the file so it is written in a single call
+    if orjson is not None:
+        payload = orjson.dumps(
+            data, option=orjson.OPT_INDENT_2 | orjson.OPT_SERIALIZE_NUMPY
+        )
+    else:
+        payload = json.dumps(data, indent=4).encode()
+
+    # Write to a temporary file and rename it over the sidecar, so a crash
+    # mid-write never leaves a truncated sidecar behind
+    tmp_path = sidecar_path.with_suffix(sidecar_path.suffix + ".tmp")
+    try:
+        tmp_path.write_bytes(payload)
+        os.replace(tmp_path, sidecar_path)
+    except OSError:
+        tmp_path.unlink(missing_ok=True)
+        raise
+
+
+# Background sidecar writes (e.g. editor auto-save) run on a single worker,
+# so they land in the order they were queued and an older write never
+# overwrites a newer one. Every sidecar read waits for them first.
+_SIDECAR_WRITER = ThreadPoolExecutor(max_workers=1, thread_name_prefix="sidecar")
+_SIDECAR_WRITES = {"last": None}
+_SIDECAR_WRITES_LOCK = threading.Lock()
+
+
+def save_sidecar_async(raw_path: str | Path, settings: dict) -> Future:
+    """
+    Queues save_sidecar on a background thread. Returns its Future.
+    """
+    with _SIDECAR_WRITES_LOCK:
+        future = _SIDECAR_WRITER.submit(save_sidecar, raw_path, settings)
+        _SIDECAR_WRITES["last"] = future
+    return future
+
+
+def flush_sidecar_writes() -> None:
+    """
+    Blocks until every queued background sidecar write has finished.
+    Errors are left to whoever queued the write.
+    """
+    with _SIDECAR_WRITES_LOCK:
+        future = _SIDECAR_WRITES["last"]
+    if future is not None:
+        # The writer is FIFO, so the last write finishing means all have
+        wait([future])
 
 
 def load_sidecar(raw_path: str | Path) -> dict | None:
@@ -870,23 +2012,59 @@ def load_sidecar(raw_path: str | Path) -> dict | None:
     Loads edit settings from a JSON sidecar file if it exists.
     Returns the settings dict or None.
     """
-    sidecar_path = get_sidecar_path(raw_path)
-    if not sidecar_path.exists():
+    flush_sidecar_writes()
+    return _read_sidecar_settings(get_sidecar_path(raw_path))
+
+
+def _read_sidecar_settings(sidecar_path):
+    """Reads and parses one sidecar file. Returns its settings dict or None."""
+    try:
+        payload = sidecar_path.read_bytes()
+    except FileNotFoundError:
         return None
 
     try:
-        with open(sidecar_path, "r") as f:
-            data = json.load(f)
-            settings = data.get("settings")
-            if settings:
-                if "rating" not in settings:
-                    settings["rating"] = 0
-            return settings
+        data = orjson.loads(payload) if orjson is not None else json.loads(payload)
+        settings = data.get("settings")
+        if settings:
+            if "rating" not in settings:
+                settings["rating"] = 0
+        return settings
     except Exception as e:
         logger.error(f"Error loading sidecar {sidecar_path}: {e}")
         return None
 
 
+def load_sidecars_for_dir(folder: str | Path) -> dict:
+    """
+    Loads the sidecars of every image in a folder at once.
+    One directory scan replaces a stat per image, and the files are read on
+    a thread pool. Returns a dict mapping RAW file names to settings; images
+    without a (readable) sidecar are absent.
+    """
+    flush_sidecar_writes()
+    sidecar_dir = Path(folder) / SIDECAR_DIR
+    try:
+        with os.scandir(sidecar_dir) as it:
+            sidecar_paths = [
+                Path(entry.path)
+                for entry in it
+                if entry.name.endswith(".json") and entry.is_file()
+            ]
+    except (FileNotFoundError, NotADirectoryError):
+        return {}
+
+    with ThreadPoolExecutor(
+        max_workers=min(8, len(sidecar_paths)) or 1, thread_name_prefix="sidecar"
+    ) as executor:
+        results = executor.map(_read_sidecar_settings, sidecar_paths)
+        return {
+            path.name[: -len(".json")]: settings
+            for path, settings in zip(sidecar_paths, results)
+            if settings is not None
+        }
+
+
 def rename_sidecar(old_raw_path: str | Path, new_raw_path: str | Path) -> None:
     """
     Renames a sidecar file when the original RAW is moved/renamed.
@@ -909,6 +2087,51 @@ def get_sidecar_mtime(raw_path: str | Path) -> float | None:
     return None
 
 
+EXIF_SCAN_BYTES = 256 * 1024
+_EXIF_IFD = 0x8769
+_DATE_TIME_ORIGINAL = 36867
+_DATE_TIME = 306
+
+
+def _exif_date(exif) -> str | None:
+    """Returns YYYY-MM-DD from DateTimeOriginal (Exif IFD) or DateTime (IFD0)."""
+    for date_str in (
+        exif.get_ifd(_EXIF_IFD).get(_DATE_TIME_ORIGINAL),
+        exif.get(_DATE_TIME),
+    ):
+        if isinstance(date_str, str):
+            # Format: "YYYY:MM:DD HH:MM:SS"
+            parts = date_str.split(" ")[0].split(":")
+            if len(parts) == 3:
+                return f"{parts[0]}-{parts[1]}-{parts[2]}"
+    return None
+
+
+def _raw_exif_date(raw_path: Path) -> str | None:
+    """
+    Reads the capture date from the first TIFF structure in a RAW file's head.
+
+    TIFF-based RAWs (DNG, NEF, CR2, ARW, ORF, RW2, ...) start with one, and
+    CR3/RAF keep one in their metadata box or embedded JPEG, so the IFDs are
+    walked directly without opening the file in LibRaw.
+    """
+    with open(raw_path, "rb") as f:
+        head = f.read(EXIF_SCAN_BYTES)
+    if head[:2] in (b"II", b"MM"):
+        # A TIFF header at offset 0, whatever its magic word: Olympus (IIRO,
+        # IIRS) and Panasonic (IIU\0) use their own, which Pillow rejects
+        magic = b"*\x00" if head[:2] == b"II" else b"\x00*"
+        tiff = head[:2] + magic + head[4:]
+    else:
+        offsets = [i for i in (head.find(b"II*\x00"), head.find(b"MM\x00*")) if i >= 0]
+        if not offsets:
+            return None
+        tiff = head[min(offsets) :]
+    exif = Image.Exif()
+    exif.load(tiff)
+    return _exif_date(exif)
+
+
 def get_exif_capture_date(raw_path: str | Path) -> str | None:
     """
     Extracts the capture date from RAW or standard image file EXIF data.
@@ -918,60 +2141,34 @@ def get_exif_capture_date(raw_path: str | Path) -> str | None:
     """
 
     raw_path = Path(raw_path)
-    ext = raw_path.suffix.lower()
-
     try:
-        if ext in STD_EXTS:
-            with Image.open(raw_path) as img:
-                exif = img.getexif()
-                if exif:
-                    # 306 = DateTime, 36867 = DateTimeOriginal
-                    for tag in (36867, 306):
-                        date_str = exif.get(tag)
-                        if date_str and isinstance(date_str, str):
-                            # Format: "YYYY:MM:DD HH:MM:SS"
-                            try:
-                                parts = date_str.split(" ")[0].split(":")
-                                if len(parts) == 3:
-                                    return f"{parts[0]}-{parts[1]}-{parts[2]}"
-                            except Exception:
-                                pass
-
-        with rawpy.imread(str(raw_path)) as raw:
-            # Try to extract EXIF DateTimeOriginal
-            # rawpy stores EXIF data that we can parse
-            try:
-                # Access the raw data structure
-                if hasattr(raw, "raw_image") and hasattr(raw, "extract_exif"):
-                    exif_data = raw.extract_exif()
-                    if exif_data:
-                        # Parse DateTimeOriginal from EXIF
-                        # Format in EXIF is typically: "2024:01:15 14:30:00"
-                        exif_str = exif_data.decode("utf-8", errors="ignore")
-
-                        # Search for date patterns in EXIF
-                        date_patterns = [
-                            r"DateTimeOriginal\s*\x00*\s*(\d{4}):(\d{2}):(\d{2})",
-                            r"DateTime\s*\x00*\s*(\d{4}):(\d{2}):(\d{2})",
-                            r"(\d{4}):(\d{2}):(\d{2})\s+(\d{2}):(\d{2}):(\d{2})",
-                        ]
-
-                        for pattern in date_patterns:
-                            match = re.search(pattern, exif_str)
-                            if match:
-                                year, month, day = match.groups()[:3]
-                                return f"{year}-{month}-{day}"
-
-            except Exception as e:
-                logger.debug(f"Error extracting EXIF from {raw_path}: {e}")
-
-        # Fallback: use file modification time
-        mtime = raw_path.stat().st_mtime
-        return datetime.fromtimestamp(mtime).strftime("%Y-%m-%d")
-
+        mtime_ns = raw_path.stat().st_mtime_ns
     except Exception as e:
         logger.error(f"Error reading file {raw_path}: {e}")
         return None
+    return _capture_date(str(raw_path), mtime_ns)
+
+
+# Library scans ask for the same files' dates repeatedly; the mtime in the key
+# invalidates an entry as soon as the file changes on disk.
+@lru_cache(maxsize=8192)
+def _capture_date(path_str, mtime_ns):
+    """Cached body of get_exif_capture_date."""
+    raw_path = Path(path_str)
+    date = None
+    try:
+        if raw_path.suffix.lower() in STD_EXTS:
+            with Image.open(raw_path) as img:
+                date = _exif_date(img.getexif())
+        else:
+            date = _raw_exif_date(raw_path)
+    except Exception as e:
+        logger.debug(f"Error extracting EXIF from {raw_path}: {e}")
+    if date:
+        return date
+
+    # Fallback: use file modification time
+    return format_date(mtime_ns / 1e9)
 
 
 def format_date(timestamp: float) -> str:
@@ -40,6 +40,9 @@ class EditingControls(QtWidgets.QWidget):
         self.val_flip_v = False
         self.rotation = 0.0
 
+        # var_name -> (slider, value_input, flipped), filled in by _add_slider
+        self._slider_info = {}
+
         # Throttling for rotation slider updates
         self._rotation_slider_throttle_timer = QtCore.QTimer()
         self._rotation_slider_throttle_timer.setSingleShot(True)
@@ -622,10 +625,14 @@ class EditingControls(QtWidgets.QWidget):
                 # Formula: actual = s_max + s_min - actual
                 actual = max_val + min_val - actual
 
-            # Update input without triggering signal loop if possible
-            val_input.blockSignals(True)
-            val_input.setText(f"{actual:.2f}")
-            val_input.blockSignals(False)
+            # Update input without triggering signal loop if possible.
+            # Slider steps are finer than the displayed precision, so most
+            # drag events leave the text unchanged and can skip the relayout.
+            text = f"{actual:.2f}"
+            if text != val_input.text():
+                val_input.blockSignals(True)
+                val_input.setText(text)
+                val_input.blockSignals(False)
 
             setattr(self, var_name, actual)
 
@@ -680,6 +687,7 @@ class EditingControls(QtWidgets.QWidget):
         # Store refs
         setattr(self, f"{var_name}_slider", slider)
         setattr(self, f"{var_name}_label", val_input)  # Store input for updates
+        self._slider_info[var_name] = (slider, val_input, flipped)
 
         # Rotation Specific: Add +/- buttons if requested (detected by var_name="rotation")
         # Or generalize if needed. User asked specifically for rotation.
@@ -749,9 +757,7 @@ class EditingControls(QtWidgets.QWidget):
 
     def set_slider_value(self, var_name, value, silent=False):
         """Set slider value programmatically, optionally without triggering signals."""
-        slider = getattr(self, f"{var_name}_slider", None)
-        label = getattr(self, f"{var_name}_label", None)
-        flipped = getattr(self, f"{var_name}_flipped", False)
+        slider, label, flipped = self._slider_info.get(var_name, (None, None, False))
 
         if silent and slider:
             slider.blockSignals(True)
@@ -789,14 +795,10 @@ class EditingControls(QtWidgets.QWidget):
 
     def reset_sliders(self, silent=False):
         """Reset all sliders to their default values."""
-        for attr_name in dir(self):
-            if attr_name.endswith("_slider"):
-                slider = getattr(self, attr_name)
-                if hasattr(slider, "default_slider_value"):
-                    var_name = attr_name.replace("_slider", "")
-                    self.set_slider_value(
-                        var_name, slider.default_slider_value / 1000.0, silent=silent
-                    )
+        for var_name, (slider, _, _) in self._slider_info.items():
+            self.set_slider_value(
+                var_name, slider.default_slider_value / 1000.0, silent=silent
+            )
 
     def _reset_section(self, section_name):
         """Reset all parameters within a specific section."""
@@ -1,3 +1,6 @@
+import os
+import threading
+from concurrent.futures import ThreadPoolExecutor, as_completed
 from pathlib import Path
 from PIL import Image
 from PySide6 import QtCore
@@ -17,11 +20,26 @@ class ExportProcessorSignals(QtCore.QObject):
     fileSkipped = QtCore.Signal(str, str, str)  # file_path, target_name, reason
 
 
+# Each in-flight export holds a full-resolution float image, so keep the
+# number of concurrent files small. RAW decode, OpenCV and the encoders
+# release the GIL, so threads are enough to overlap files.
+MAX_EXPORT_WORKERS = min(4, os.cpu_count() or 1)
+
+# pillow_heif options are process-global; guard the temporary 12-bit toggle
+_HEIF_OPTIONS_LOCK = threading.Lock()
+
+
 class ExportProcessor(QtCore.QRunnable):
     """Handles export processing in a background thread."""
 
     def __init__(
-        self, signals, files, settings, destination_folder, rename_mapping=None
+        self,
+        signals,
+        files,
+        settings,
+        destination_folder,
+        rename_mapping=None,
+        max_workers=MAX_EXPORT_WORKERS,
     ):
         super().__init__()
         self.signals = signals
@@ -29,29 +47,44 @@ class ExportProcessor(QtCore.QRunnable):
         self.settings = settings
         self.destination_folder = destination_folder
         self.rename_mapping = rename_mapping or {}
+        self.max_workers = max(1, max_workers)
         self._cancelled = False
 
     def run(self):
-        """Execute the export batch."""
+        """Execute the export batch, exporting several files concurrently."""
         count = len(self.files)
         success_count = 0
         skipped_count = 0
+        completed = 0
+
+        if count == 0:
+            self.signals.batchCompleted.emit(0, 0, 0)
+            return
+
+        with ThreadPoolExecutor(max_workers=min(self.max_workers, count)) as executor:
+            futures = {
+                executor.submit(self._export_file, file): file for file in self.files
+            }
+            for future in as_completed(futures):
+                if self._cancelled:
+                    executor.shutdown(wait=False, cancel_futures=True)
+                    break
+
+                file = futures[future]
+                try:
+                    result = future.result()
+                except Exception as e:
+                    self.signals.error.emit(f"Failed to export {file}: {e}")
+                    executor.shutdown(wait=False, cancel_futures=True)
+                    break
 
-        for i, file in enumerate(self.files):
-            if self._cancelled:
-                break
-
-            try:
-                result = self._export_file(file)
                 if result == "skipped":
                     skipped_count += 1
                 else:
                     success_count += 1
                     self.signals.fileProcessed.emit(str(file))
-                self.signals.progress.emit(int(100 * (i + 1) / count))
-            except Exception as e:
-                self.signals.error.emit(f"Failed to export {file}: {e}")
-                break
+                completed += 1
+                self.signals.progress.emit(int(100 * completed / count))
 
         if not self._cancelled:
             self.signals.batchCompleted.emit(success_count, skipped_count, count)
@@ -91,25 +124,15 @@ class ExportProcessor(QtCore.QRunnable):
         # Get sidecar settings
         sidecar_settings = pynegative.load_sidecar(str(file_path)) or {}
 
-        # Process image with tone mapping
-        img, _ = pynegative.apply_tone_map(
-            full_img,
-            temperature=sidecar_settings.get("temperature", 0.0),
-            tint=sidecar_settings.get("tint", 0.0),
-            exposure=sidecar_settings.get("exposure", 0.0),
-            contrast=sidecar_settings.get("contrast", 1.0),
-            blacks=sidecar_settings.get("blacks", 0.0),
-            whites=sidecar_settings.get("whites", 1.0),
-            shadows=sidecar_settings.get("shadows", 0.0),
-            highlights=sidecar_settings.get("highlights", 0.0),
-            saturation=sidecar_settings.get("saturation", 1.0),
-        )
-
-        # Convert to PIL Image
+        # Tone map straight to integer pixels; the full-res float result is
+        # dropped as soon as it has been converted, and no stats are computed
         if output_bps == 16:
-            pil_img = Image.fromarray((img * 65535).astype("uint16"), "RGB")
+            pixels = pynegative.process_to_uint16(full_img, sidecar_settings)
+            pil_img = Image.fromarray(pixels, "RGB")
         else:
-            pil_img = Image.fromarray((img * 255).astype("uint8"))
+            pixels = pynegative.process_to_uint8(full_img, sidecar_settings)
+            pil_img = Image.fromarray(pixels)
+        del full_img, pixels
 
         # Apply Geometry (Flip, Rotate, Crop)
         pil_img = pynegative.apply_geometry(
@@ -176,7 +199,7 @@ class ExportProcessor(QtCore.QRunnable):
             )
             return "skipped"
 
-        pil_img.save(str(dest_path), quality=quality)
+        pynegative.save_jpeg(pil_img, dest_path, quality=quality)
         return "success"
 
     def _save_heif(self, pil_img, file_name):
@@ -197,15 +220,18 @@ class ExportProcessor(QtCore.QRunnable):
             return "skipped"
 
         if bit_depth_str == "12-bit":
-            original_setting = pillow_heif.options.SAVE_HDR_TO_12_BIT
-            pillow_heif.options.SAVE_HDR_TO_12_BIT = True
-            try:
-                pil_img.save(str(dest_path), format="HEIF", quality=quality)
-            finally:
-                pillow_heif.options.SAVE_HDR_TO_12_BIT = original_setting
+            with _HEIF_OPTIONS_LOCK:
+                original_setting = pillow_heif.options.SAVE_HDR_TO_12_BIT
+                pillow_heif.options.SAVE_HDR_TO_12_BIT = True
+                try:
+                    pil_img.save(str(dest_path), format="HEIF", quality=quality)
+                finally:
+                    pillow_heif.options.SAVE_HDR_TO_12_BIT = original_setting
         elif bit_depth_str == "10-bit":
-            # 16-bit images are saved as 10-bit by default
-            pil_img.save(str(dest_path), format="HEIF", quality=quality)
+            # 16-bit images are saved as 10-bit by default; hold the lock so a
+            # concurrent 12-bit export can't flip the option mid-save
+            with _HEIF_OPTIONS_LOCK:
+                pil_img.save(str(dest_path), format="HEIF", quality=quality)
         else:
             # 8-bit
             pil_img.save(str(dest_path), format="HEIF", quality=quality)
@@ -256,8 +256,11 @@ class GalleryWidget(QtWidgets.QWidget):
         filter_mode = main_window.filter_combo.currentText()
         filter_rating = main_window.filter_rating_widget.rating()
 
+        # Read every sidecar in one pass rather than one lookup per image
+        sidecars = pynegative.load_sidecars_for_dir(self.current_folder)
+
         for path in files:
-            sidecar_settings = pynegative.load_sidecar(str(path))
+            sidecar_settings = sidecars.get(path.name)
             rating = sidecar_settings.get("rating", 0) if sidecar_settings else 0
 
             if filter_rating > 0:
@@ -1,5 +1,4 @@
 import numpy as np
-from PIL import Image, ImageQt
 from PySide6 import QtCore, QtGui
 import time
 import cv2
@@ -24,6 +23,8 @@ class PipelineCache:
         self.caches = {}
         # Effect parameters that are estimated once on the preview and synced
         self.estimated_params = {}
+        # Bumped whenever the cached stages are dropped (e.g. a new image)
+        self.epoch = 0
 
     def get(self, resolution, stage_id, current_params):
         """Returns the cached array if parameters match exactly."""
@@ -50,6 +51,7 @@ class PipelineCache:
         if stage_id is None:
             self.caches = {}
             self.estimated_params = {}
+            self.epoch += 1
         else:
             # In real-world use, we'd only invalidate from a certain stage onwards
             # but for simplicity in this prototype, we'll clear per resolution
@@ -58,6 +60,30 @@ class PipelineCache:
     def clear(self):
         self.caches = {}
         self.estimated_params = {}
+        self.epoch += 1
+
+
+def _preview_uses_lut(settings):
+    """True when the background preview can be rendered from the uint8 LUT path."""
+    heavy_active = (
+        settings.get("de_haze", 0) > 0
+        or settings.get("de_noise", 0) > 0
+        or settings.get("sharpen_value", 0) > 0
+    )
+    return not heavy_active and pynegative.is_tone_lut_compatible(
+        settings.get("shadows", 0.0),
+        settings.get("highlights", 0.0),
+        settings.get("saturation", 1.0),
+    )
+
+
+def _uint8_to_pixmap(img_uint8):
+    """Wrap an RGB/RGBA uint8 array in a QImage and copy it into a QPixmap."""
+    img = np.ascontiguousarray(img_uint8)
+    h, w, c = img.shape
+    fmt = QtGui.QImage.Format_RGBA8888 if c == 4 else QtGui.QImage.Format_RGB888
+    qimage = QtGui.QImage(img.data, w, h, c * w, fmt)
+    return QtGui.QPixmap.fromImage(qimage)
 
 
 class ImageProcessorWorker(QtCore.QRunnable):
@@ -76,6 +102,8 @@ class ImageProcessorWorker(QtCore.QRunnable):
         calculate_histogram=False,
         cache=None,
         last_heavy_adjusted="de_haze",
+        base_img_preview_u8=None,
+        preview_out=None,
     ):
         super().__init__()
         self.signals = signals
@@ -89,6 +117,14 @@ class ImageProcessorWorker(QtCore.QRunnable):
         self.calculate_histogram = calculate_histogram
         self.cache = cache
         self.last_heavy_adjusted = last_heavy_adjusted
+        self.base_img_preview_u8 = base_img_preview_u8
+        # Reusable uint8 buffer for the background frame (one worker at a time)
+        self.preview_out = preview_out
+
+    def _preview_buffer(self, shape):
+        if self.preview_out is not None and self.preview_out.shape == shape:
+            return self.preview_out
+        return None
 
     def run(self):
         try:
@@ -151,6 +187,7 @@ class ImageProcessorWorker(QtCore.QRunnable):
                 sharpen_p["sharpen_radius"],
                 sharpen_p["sharpen_percent"],
                 "High Quality",
+                cache_key=stage_input_key,
             )
 
         # 3. Determine execution order based on the last adjusted parameter.
@@ -183,6 +220,19 @@ class ImageProcessorWorker(QtCore.QRunnable):
         processed = img
         accumulated_params = {}
         for i, (name, params, func) in enumerate(pipeline):
+            # Describes this stage's input pixels: same image, tier, zoom and
+            # upstream settings give the same input even if it was recomputed
+            stage_input_key = (
+                (
+                    self.cache.epoch,
+                    res_key,
+                    zoom_scale,
+                    tuple(stage for stage, _, _ in pipeline[:i]),
+                    tuple(sorted(accumulated_params.items())),
+                )
+                if self.cache
+                else None
+            )
             accumulated_params.update(params)
             stage_id = f"heavy_stage_{i + 1}_{name}"
 
@@ -235,11 +285,6 @@ class ImageProcessorWorker(QtCore.QRunnable):
             "sharpen_percent": self.settings.get("sharpen_percent", 0.0),
         }
 
-        # Use helper to get/calculate cached heavy background
-        processed_bg = self._process_heavy_stage(
-            img_render_base, res_key, heavy_params, zoom_scale
-        )
-
         # Stage 2: Tone Mapping (Fast)
         tone_map_settings = {
             "temperature": self.settings.get("temperature", 0.0),
@@ -253,16 +298,39 @@ class ImageProcessorWorker(QtCore.QRunnable):
             "saturation": self.settings.get("saturation", 1.0),
         }
 
-        # Apply Tone Map to the result of heavy stage
-        bg_output, _ = pynegative.apply_tone_map(
-            processed_bg, **tone_map_settings, calculate_stats=False
+        use_lut = self.base_img_preview_u8 is not None and _preview_uses_lut(
+            self.settings
         )
 
-        # Prepare image for geometry (convert to uint8 for OpenCV)
-        if isinstance(bg_output, Image.Image):
-            img_uint8 = np.array(bg_output)
+        if use_lut:
+            # Per-channel curve only: a single uint8 table lookup replaces the
+            # float pipeline for the background
+            lut = pynegative.build_tone_lut(
+                exposure=tone_map_settings["exposure"],
+                contrast=tone_map_settings["contrast"],
+                blacks=tone_map_settings["blacks"],
+                whites=tone_map_settings["whites"],
+                temperature=tone_map_settings["temperature"],
+                tint=tone_map_settings["tint"],
+            )
+            img_uint8 = pynegative.apply_tone_lut(
+                self.base_img_preview_u8,
+                lut,
+                out=self._preview_buffer(self.base_img_preview_u8.shape),
+            )
         else:
-            img_uint8 = (bg_output * 255).astype(np.uint8)
+            # Use helper to get/calculate cached heavy background
+            processed_bg = self._process_heavy_stage(
+                img_render_base, res_key, heavy_params, zoom_scale
+            )
+
+            # Tone map the result of the heavy stage straight to uint8 for
+            # geometry (OpenCV) and display
+            img_uint8 = pynegative.process_to_uint8(
+                processed_bg,
+                tone_map_settings,
+                out=self._preview_buffer(processed_bg.shape),
+            )
 
         rotate_val = self.settings.get("rotation", 0.0)
         flip_h = self.settings.get("flip_h", False)
@@ -305,12 +373,12 @@ class ImageProcessorWorker(QtCore.QRunnable):
             if x2 > x1 and y2 > y1:
                 img_uint8 = img_uint8[y1:y2, x1:x2]
 
-        pil_bg = Image.fromarray(img_uint8)
-        preview_h, preview_w = self.base_img_preview.shape[:2]
+        preview_src = self.base_img_preview_u8 if use_lut else self.base_img_preview
+        preview_h, preview_w = preview_src.shape[:2]
         scale_x = full_w / preview_w
         scale_y = full_h / preview_h
-        new_full_w = int(pil_bg.width * scale_x)
-        new_full_h = int(pil_bg.height * scale_y)
+        new_full_w = int(img_uint8.shape[1] * scale_x)
+        new_full_h = int(img_uint8.shape[0] * scale_y)
 
         if self.calculate_histogram:
             try:
@@ -319,7 +387,8 @@ class ImageProcessorWorker(QtCore.QRunnable):
             except Exception as e:
                 print(f"Histogram calculation error: {e}")
 
-        pix_bg = QtGui.QPixmap.fromImage(ImageQt.ImageQt(pil_bg))
+        # fromImage copies, so the scratch buffer is free for the next frame
+        pix_bg = _uint8_to_pixmap(img_uint8)
 
         # --- Part 2: Detail ROI ---
         pix_roi, roi_x, roi_y, roi_w, roi_h = QtGui.QPixmap(), 0, 0, 0, 0
@@ -376,16 +445,13 @@ class ImageProcessorWorker(QtCore.QRunnable):
                     flip_code = -1 if (flip_h and flip_v) else (1 if flip_h else 0)
                     crop_chunk = cv2.flip(crop_chunk, flip_code)
 
-                # Tone Map for ROI (Fast) - operates on the already heavy-processed chunk
-                processed_roi, _ = pynegative.apply_tone_map(
-                    crop_chunk, **tone_map_settings, calculate_stats=False
+                # Tone Map for ROI (Fast) - operates on the already heavy-processed chunk.
+                # The Numba kernel is only warmed up for C-contiguous input; a
+                # strided slice would JIT-compile a new specialization on first zoom
+                roi_uint8 = pynegative.process_to_uint8(
+                    np.ascontiguousarray(crop_chunk), tone_map_settings
                 )
-
-                if isinstance(processed_roi, Image.Image):
-                    pil_roi = processed_roi
-                else:
-                    pil_roi = Image.fromarray((processed_roi * 255).astype(np.uint8))
-                pix_roi = QtGui.QPixmap.fromImage(ImageQt.ImageQt(pil_roi))
+                pix_roi = _uint8_to_pixmap(roi_uint8)
                 roi_x, roi_y = src_x - offset_x, src_y - offset_y
                 roi_w, roi_h = req_w, req_h
 
@@ -452,16 +518,24 @@ class ImageProcessingPipeline(QtCore.QObject):
     def __init__(self, thread_pool, parent=None):
         super().__init__(parent)
         self.thread_pool = thread_pool
+        # Coalesces bursts of slider events into roughly one render per frame
         self.render_timer = QtCore.QTimer()
         self.render_timer.setSingleShot(True)
+        self.render_timer.setInterval(16)  # ~60fps
         self.render_timer.timeout.connect(self._on_render_timer_timeout)
         self._render_pending = False
         self._is_rendering_locked = False
+        # Settings + view state of the last displayed render, to skip no-op
+        # repeats; keys of in-flight renders wait here until accepted
+        self._last_render_key = None
+        self._pending_render_keys = {}
         self.base_img_full = None
         self.base_img_half = None
         self.base_img_quarter = None
-        self.base_img_preview = None
-        self._unedited_img_full = None  # Original raw data for unedited comparison
+        self._base_img_preview = None  # float32, built on demand
+        self.base_img_preview_u8 = None
+        self._preview_out = None  # Scratch output reused by every render
+        self._unedited_uint8 = None  # Display-ready original for unedited comparison
         self._processing_params = {}
         self._last_heavy_adjusted = "de_haze"
         self._view_ref = None
@@ -480,34 +554,40 @@ class ImageProcessingPipeline(QtCore.QObject):
 
     def set_image(self, img_array):
         self.base_img_full = img_array
-        # Store original unedited data for comparison
-        if img_array is not None:
-            self._unedited_img_full = img_array.copy()
-        else:
-            self._unedited_img_full = None
+        # Cache the original as uint8 once; it never changes while editing
+        self._unedited_uint8 = (
+            self._to_display_uint8(img_array) if img_array is not None else None
+        )
         self.cache.clear()
+        self._last_render_key = None
+        self._pending_render_keys.clear()
         # Reset processing parameters for the new image to avoid carrying over
         # edits from the previous one, unless we explicitly load them.
         self._processing_params = {}
         if img_array is not None:
             h, w, _ = img_array.shape
 
+            # Tiers are built as a pyramid with area resampling: each level is
+            # decimated from the previous one instead of from the full image.
             # 1. Create a 50% scale RAW for intermediate zooms (75% <= Zoom < 200%)
             self.base_img_half = cv2.resize(
-                img_array, (w // 2, h // 2), interpolation=cv2.INTER_LINEAR
+                img_array, (w // 2, h // 2), interpolation=cv2.INTER_AREA
             )
 
             # 2. Create a 25% scale RAW for lower zooms (Fit < Zoom < 75%)
             self.base_img_quarter = cv2.resize(
-                img_array, (w // 4, h // 4), interpolation=cv2.INTER_LINEAR
+                self.base_img_half, (w // 4, h // 4), interpolation=cv2.INTER_AREA
             )
 
-            # 3. Create a 2048px float32 preview for global background.
-            scale = 2048 / max(h, w)
-            target_h, target_w = int(h * scale), int(w * scale)
-            self.base_img_preview = cv2.resize(
-                img_array, (target_w, target_h), interpolation=cv2.INTER_LINEAR
-            )
+            # 3. Create a 2048px uint8 preview for global background. The
+            # interactive LUT path only ever reads this copy; the float32
+            # version is built on first use by the full pipeline.
+            self._base_img_preview = None
+            preview = self._build_preview_tier()
+            np.clip(preview, 0.0, 1.0, out=preview)
+            self.base_img_preview_u8 = pynegative.float_to_uint8(preview)
+            del preview
+            self._preview_out = np.empty_like(self.base_img_preview_u8)
 
             # Emit unedited pixmap update
             unedited_pixmap = self.get_unedited_pixmap()
@@ -515,35 +595,63 @@ class ImageProcessingPipeline(QtCore.QObject):
         else:
             self.base_img_half = None
             self.base_img_quarter = None
-            self.base_img_preview = None
+            self._base_img_preview = None
+            self.base_img_preview_u8 = None
+            self._preview_out = None
+
+    @property
+    def base_img_preview(self):
+        """2048px float32 preview tier, resized from the pyramid on first access."""
+        if self._base_img_preview is None and self.base_img_full is not None:
+            self._base_img_preview = self._build_preview_tier()
+        return self._base_img_preview
+
+    def _build_preview_tier(self):
+        h, w, _ = self.base_img_full.shape
+        scale = 2048 / max(h, w)
+        target_h, target_w = int(h * scale), int(w * scale)
+        preview_src = self.base_img_full
+        for tier in (self.base_img_quarter, self.base_img_half):
+            if tier.shape[0] >= target_h and tier.shape[1] >= target_w:
+                preview_src = tier
+                break
+        return cv2.resize(
+            preview_src,
+            (target_w, target_h),
+            interpolation=cv2.INTER_AREA if scale < 1.0 else cv2.INTER_LINEAR,
+        )
 
     def set_view_reference(self, view):
         self._view_ref = view
 
-    def get_unedited_pixmap(self) -> QtGui.QPixmap:
-        """Convert the unedited raw image to a QPixmap for comparison view."""
-        if self._unedited_img_full is None:
-            return QtGui.QPixmap()
-
+    @staticmethod
+    def _to_display_uint8(img_array):
+        """Convert raw image data to contiguous RGB uint8 for display."""
         try:
             # Normalize to 0-1 range if needed
-            img = self._unedited_img_full.astype(np.float32)
+            img = img_array.astype(np.float32)
             if img.max() > 1.0:
-                img = img / 255.0
+                img /= 255.0
 
             # Clamp to 0-1 range
-            img = np.clip(img, 0.0, 1.0)
-
-            # Convert to uint8 for display
-            img_uint8 = (img * 255).astype(np.uint8)
+            np.clip(img, 0.0, 1.0, out=img)
+            img_uint8 = pynegative.float_to_uint8(img)
 
             # Convert to RGB if needed
             if img_uint8.shape[2] == 4:
-                img_rgb = cv2.cvtColor(img_uint8, cv2.COLOR_RGBA2RGB)
-            else:
-                img_rgb = img_uint8
+                img_uint8 = cv2.cvtColor(img_uint8, cv2.COLOR_RGBA2RGB)
+            return np.ascontiguousarray(img_uint8)
+        except Exception:
+            return None
+
+    def get_unedited_pixmap(self) -> QtGui.QPixmap:
+        """Convert the unedited raw image to a QPixmap for comparison view."""
+        if self._unedited_uint8 is None:
+            return QtGui.QPixmap()
 
+        try:
             # Convert to QImage then QPixmap
+            img_rgb = self._unedited_uint8
             h, w, c = img_rgb.shape
             bytes_per_line = c * w
             qimage = QtGui.QImage(
@@ -574,8 +682,25 @@ class ImageProcessingPipeline(QtCore.QObject):
         if self.base_img_full is None:
             return
         self._render_pending = True
-        if not self._is_rendering_locked:
-            self._process_pending_update()
+        if not self._is_rendering_locked and not self.render_timer.isActive():
+            self.render_timer.start()
+
+    def _render_key(self, settings):
+        """Everything a render depends on, or None if the view can't be read."""
+        try:
+            view = self._view_ref
+            viewport = view.viewport()
+            return (
+                repr(sorted(settings.items())),
+                self.histogram_enabled,
+                view.transform().m11(),
+                viewport.width(),
+                viewport.height(),
+                getattr(view, "_is_fitting", False),
+                view.mapToScene(viewport.rect()).boundingRect().getRect(),
+            )
+        except (AttributeError, RuntimeError):
+            return None
 
     def _process_pending_update(self):
         if (
@@ -585,27 +710,41 @@ class ImageProcessingPipeline(QtCore.QObject):
         ):
             return
         self._render_pending = False
+
+        # Slider releases and repeated signals often re-request the frame
+        # that is already on screen; skip the render entirely in that case.
+        settings = self.get_current_settings()
+        render_key = self._render_key(settings)
+        if render_key is not None and render_key == self._last_render_key:
+            return
+
         self._is_rendering_locked = True
         self.perf_start_time = time.perf_counter()
 
         self._current_request_id += 1
+        self._pending_render_keys[self._current_request_id] = render_key
         worker = ImageProcessorWorker(
             self.signals,
             self._view_ref,
             self.base_img_full,
             self.base_img_half,
             self.base_img_quarter,
-            self.base_img_preview,
-            self.get_current_settings(),
+            # The float preview is only needed when the LUT path can't be used
+            None if _preview_uses_lut(settings) else self.base_img_preview,
+            settings,
             self._current_request_id,
             calculate_histogram=self.histogram_enabled,
             cache=self.cache,
             last_heavy_adjusted=self._last_heavy_adjusted,
+            base_img_preview_u8=self.base_img_preview_u8,
+            preview_out=self._preview_out,
         )
         self.thread_pool.start(worker)
 
     def _on_render_timer_timeout(self):
-        pass
+        # A busy worker picks up the pending request when it finishes
+        if not self._is_rendering_locked:
+            self._process_pending_update()
 
     def _measure_and_emit_perf(self):
         elapsed_ms = (time.perf_counter() - self.perf_start_time) * 1000
@@ -626,6 +765,7 @@ class ImageProcessingPipeline(QtCore.QObject):
     ):
         # Unlock rendering since the worker has finished
         self._is_rendering_locked = False
+        render_key = self._pending_render_keys.pop(request_id, None)
 
         if request_id < self._last_processed_id:
             # If we were locked and a new request came in, process it now
@@ -633,6 +773,8 @@ class ImageProcessingPipeline(QtCore.QObject):
                 self._process_pending_update()
             return
         self._last_processed_id = request_id
+        # Only a frame that actually reaches the screen may suppress repeats
+        self._last_render_key = render_key
 
         # Emit preview update (original signal)
         self.previewUpdated.emit(
@@ -658,6 +800,8 @@ class ImageProcessingPipeline(QtCore.QObject):
     def _on_worker_error(self, error_message, request_id):
         # Always unlock on error so we can try again
         self._is_rendering_locked = False
+        self._pending_render_keys.pop(request_id, None)
+        self._last_render_key = None
         if self._render_pending:
             self._process_pending_update()
 
@@ -38,7 +38,7 @@ class ThumbnailLoader(QtCore.QRunnable):
                 return
 
             # use the optimized extract_thumbnail from core
-            pil_img = pynegative.extract_thumbnail(self.path)
+            pil_img = pynegative.extract_thumbnail(self.path, size=self.size)
             metadata = {}
 
             if pil_img:
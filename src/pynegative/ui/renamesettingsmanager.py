@@ -1,8 +1,8 @@
 from pathlib import Path
 from typing import List, Optional, Tuple
-from datetime import datetime
 from PySide6 import QtCore
-import rawpy
+
+from .. import core as pynegative
 
 
 class RenameSettingsManager(QtCore.QObject):
@@ -56,63 +56,7 @@ class RenameSettingsManager(QtCore.QObject):
         Returns date as YYYY-MM-DD string or None if unavailable.
         Falls back to file modification date if EXIF date unavailable.
         """
-        try:
-            with rawpy.imread(raw_path) as raw:
-                # Try to get DateTimeOriginal from EXIF
-                if hasattr(raw, "extract_exif") or hasattr(raw, "raw_image"):
-                    # rawpy doesn't directly expose EXIF, but we can access it
-                    # through the raw structure if available
-                    exif_data = None
-                    if hasattr(raw, "extract_exif"):
-                        try:
-                            exif_data = raw.extract_exif()
-                        except Exception:
-                            pass
-
-                    # If we have EXIF data, parse it
-                    if exif_data:
-                        # Parse DateTimeOriginal from EXIF
-                        # This is a simplified parser - in production you might
-                        # want to use a more robust EXIF library
-                        return self._parse_exif_date(exif_data)
-
-            # Fallback to file modification time
-            mtime = Path(raw_path).stat().st_mtime
-            return datetime.fromtimestamp(mtime).strftime("%Y-%m-%d")
-
-        except Exception as e:
-            print(f"Error reading EXIF date from {raw_path}: {e}")
-            # Fallback to file modification time
-            try:
-                mtime = Path(raw_path).stat().st_mtime
-                return datetime.fromtimestamp(mtime).strftime("%Y-%m-%d")
-            except (OSError, IOError):
-                return None
-
-    def _parse_exif_date(self, exif_data: bytes) -> Optional[str]:
-        """Parse DateTimeOriginal from EXIF data.
-
-        This is a basic parser. For more robust parsing, consider using
-        a dedicated EXIF library.
-        """
-        try:
-            # Look for DateTimeOriginal tag (0x9003) in EXIF
-            # Format is typically: "2024:01:15 14:30:00"
-            exif_str = exif_data.decode("utf-8", errors="ignore")
-
-            # Search for common date patterns
-            import re
-
-            # Match YYYY:MM:DD or YYYY-MM-DD patterns
-            date_match = re.search(r"(\d{4})[:/-](\d{2})[:/-](\d{2})", exif_str)
-            if date_match:
-                year, month, day = date_match.groups()
-                return f"{year}-{month}-{day}"
-
-        except Exception as e:
-            print(f"Error parsing EXIF date: {e}")
-
-        return None
+        return pynegative.get_exif_capture_date(raw_path)
 
     def generate_preview(
         self,
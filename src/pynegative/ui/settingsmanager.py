@@ -1,8 +1,11 @@
+import logging
 from pathlib import Path
 from PySide6 import QtCore
 from .undomanager import UndoManager
 from .. import core as pynegative
 
+logger = logging.getLogger(__name__)
+
 
 class SettingsManager(QtCore.QObject):
     # Signals
@@ -153,11 +156,23 @@ class SettingsManager(QtCore.QObject):
 
         save_settings = settings.copy()
         save_settings["rating"] = rating
-        pynegative.save_sidecar(path, save_settings)
+        # Written off the UI thread; sidecar reads wait for it to land
+        future = pynegative.save_sidecar_async(path, save_settings)
+        future.add_done_callback(self._on_save_done)
+
+    def wait_for_pending_save(self):
+        """Block until queued background sidecar saves have been written."""
+        pynegative.flush_sidecar_writes()
+
+    @staticmethod
+    def _on_save_done(future):
+        error = future.exception()
+        if error is not None:
+            logger.error(f"Failed to save sidecar: {error}")
 
     def _apply_settings_to_photo(self, path, settings):
         """Apply settings to a photo by saving to its sidecar."""
-        # Load existing sidecar to preserve rating
+        # Load existing sidecar to preserve rating (waits for queued auto-saves)
         existing_settings = pynegative.load_sidecar(path) or {}
         rating = existing_settings.get("rating", 0)
 
@@ -91,7 +91,12 @@ class ZoomableGraphicsView(QtWidgets.QGraphicsView):
         roi_w=0,
         roi_h=0,
     ):
-        """Unified update for both layers to ensure alignment."""
+        """Unified update for both layers to ensure alignment.
+
+        The pixmap items are persistent; scene rect and item transforms are
+        only touched when the geometry changes, so a slider drag just swaps
+        pixmaps without invalidating the whole scene.
+        """
         if bg_pix is None:
             bg_pix = QtGui.QPixmap()
         if roi_pix is None:
@@ -99,13 +104,17 @@ class ZoomableGraphicsView(QtWidgets.QGraphicsView):
         # 1. Update Background
         self._bg_item.setPixmap(bg_pix)
         if not bg_pix.isNull() and bg_pix.width() > 0:
-            s_w = full_w / bg_pix.width()
-            s_h = full_h / bg_pix.height()
-            self._bg_item.setTransform(QtGui.QTransform.fromScale(s_w, s_h))
+            bg_transform = QtGui.QTransform.fromScale(
+                full_w / bg_pix.width(), full_h / bg_pix.height()
+            )
+            if self._bg_item.transform() != bg_transform:
+                self._bg_item.setTransform(bg_transform)
 
         # 2. Update Scene Rect
-        self._scene.setSceneRect(0, 0, full_w, full_h)
-        self._update_fit_in_view_scale()
+        scene_rect = QRectF(0, 0, full_w, full_h)
+        if self._scene.sceneRect() != scene_rect:
+            self._scene.setSceneRect(scene_rect)
+            self._update_fit_in_view_scale()
 
         # 3. Update ROI
         if not roi_pix.isNull():
@@ -115,9 +124,11 @@ class ZoomableGraphicsView(QtWidgets.QGraphicsView):
             if roi_w > 0 and roi_pix.width() > 0:
                 rs_w = roi_w / roi_pix.width()
                 rs_h = roi_h / roi_pix.height()
-                self._fg_item.setTransform(QtGui.QTransform.fromScale(rs_w, rs_h))
+                fg_transform = QtGui.QTransform.fromScale(rs_w, rs_h)
             else:
-                self._fg_item.setTransform(QtGui.QTransform())
+                fg_transform = QtGui.QTransform()
+            if self._fg_item.transform() != fg_transform:
+                self._fg_item.setTransform(fg_transform)
             self._fg_item.show()
         else:
             self._fg_item.hide()
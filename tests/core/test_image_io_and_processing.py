@@ -2,10 +2,15 @@
 """Unit tests for image I/O and processing functions in pynegative.core"""
 
 import pytest
-from PIL import Image
+import numpy as np
+from PIL import Image, ImageFilter, ImageOps
+import os
 import tempfile
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from io import BytesIO
 from pathlib import Path
-from unittest.mock import patch
+from unittest.mock import MagicMock, patch
 
 import pynegative
 
@@ -35,6 +40,166 @@ class TestSharpening:
         except TypeError as e:
             pytest.fail(f"sharpen_image failed with floats: {e}")
 
+    def test_numba_blend_matches_numpy(self):
+        """The fused unsharp blend matches the NumPy reference path"""
+        pytest.importorskip("numba")
+        rng = np.random.default_rng(0)
+        img = rng.random((40, 40, 3), dtype=np.float32)
+
+        fused = pynegative.sharpen_image(img, radius=1.5, percent=120)
+        with patch.object(pynegative.core, "NUMBA_AVAILABLE", False):
+            reference = pynegative.sharpen_image(img, radius=1.5, percent=120)
+
+        np.testing.assert_allclose(fused, reference, atol=1e-5)
+
+    def test_concurrent_sharpening_serialises_numba_kernel(self):
+        """Sharpening from several threads runs the parallel kernel under the lock"""
+        pytest.importorskip("numba")
+        if pynegative.core.cv2 is None:
+            pytest.skip("OpenCV not installed")
+        rng = np.random.default_rng(2)
+        images = [rng.random((48, 48, 3), dtype=np.float32) for _ in range(4)]
+        expected = [
+            pynegative.sharpen_image(img.copy(), radius=1.5, percent=120)
+            for img in images
+        ]
+        kernel = pynegative.core._unsharp_blend_kernel
+        lock_held = []
+
+        def checked_kernel(*args):
+            lock_held.append(pynegative.core._NUMBA_LOCK.locked())
+            return kernel(*args)
+
+        with (
+            patch.object(pynegative.core, "_unsharp_blend_kernel", checked_kernel),
+            ThreadPoolExecutor(max_workers=4) as pool,
+        ):
+            results = list(
+                pool.map(
+                    lambda img: pynegative.sharpen_image(
+                        img.copy(), radius=1.5, percent=120
+                    ),
+                    images,
+                )
+            )
+
+        assert lock_held and all(lock_held)
+        for result, reference in zip(results, expected):
+            np.testing.assert_allclose(result, reference, atol=1e-6)
+
+    def test_amount_change_reuses_blur_and_edges(self):
+        """Re-sharpening the same keyed array at a new amount skips blur and Canny"""
+        if pynegative.core.cv2 is None:
+            pytest.skip("OpenCV not installed")
+        img = np.random.default_rng(1).random((40, 40, 3), dtype=np.float32)
+        cv2 = pynegative.core.cv2
+
+        with (
+            patch.object(cv2, "GaussianBlur", wraps=cv2.GaussianBlur) as blur,
+            patch.object(cv2, "Canny", wraps=cv2.Canny) as canny,
+        ):
+            first = pynegative.sharpen_image(img, 1.5, 50, cache_key="a")
+            second = pynegative.sharpen_image(img, 1.5, 150, cache_key="a")
+            assert (blur.call_count, canny.call_count) == (1, 1)
+
+            pynegative.sharpen_image(img, 2.5, 150, cache_key="a")
+            assert (blur.call_count, canny.call_count) == (2, 1)
+
+            pynegative.sharpen_image(img.copy(), 2.5, 150, cache_key="a")
+            assert (blur.call_count, canny.call_count) == (3, 2)
+
+            pynegative.sharpen_image(img, 2.5, 150)
+            pynegative.sharpen_image(img, 2.5, 150)
+            assert (blur.call_count, canny.call_count) == (5, 4)
+
+        assert not np.array_equal(first, second)
+
+    def test_in_place_mutation_is_not_served_stale_maps(self):
+        """Sharpening an array changed in place reflects its new pixels"""
+        if pynegative.core.cv2 is None:
+            pytest.skip("OpenCV not installed")
+        rng = np.random.default_rng(3)
+        img = rng.random((40, 40, 3), dtype=np.float32)
+        replacement = rng.random((40, 40, 3), dtype=np.float32)
+        expected = pynegative.sharpen_image(replacement.copy(), 1.5, 120)
+
+        for first_key, second_key in ((None, None), ("stage", "stage-changed")):
+            buffer = img.copy()
+            before = pynegative.sharpen_image(buffer, 1.5, 120, cache_key=first_key)
+            buffer[:] = replacement
+            after = pynegative.sharpen_image(buffer, 1.5, 120, cache_key=second_key)
+
+            assert not np.array_equal(before, after)
+            np.testing.assert_array_equal(after, expected)
+
+    def test_pil_fallback_uses_opencv_unsharp(self):
+        """The non High Quality PIL path sharpens a step edge with overshoot"""
+        arr = np.full((20, 20, 3), 64, dtype=np.uint8)
+        arr[:, 10:] = 192
+        pil_img = Image.fromarray(arr)
+
+        result = np.asarray(
+            pynegative.sharpen_image(pil_img, radius=1.0, percent=100, method="Fast")
+        )
+
+        assert result[0, 9, 0] < 64
+        assert result[0, 10, 0] > 192
+        np.testing.assert_array_equal(result[:, :5], arr[:, :5])
+
+    def test_pil_fallback_keeps_unsharp_threshold(self):
+        """Low-amplitude noise on a flat area is left as Pillow's UnsharpMask does"""
+        rng = np.random.default_rng(4)
+        arr = (128 + rng.integers(-1, 2, size=(32, 32, 3))).astype(np.uint8)
+        pil_img = Image.fromarray(arr)
+
+        result = pynegative.sharpen_image(
+            pil_img, radius=2.0, percent=150, method="Fast"
+        )
+        expected = pil_img.filter(ImageFilter.UnsharpMask(radius=2.0, percent=150))
+
+        np.testing.assert_array_equal(np.asarray(result), np.asarray(expected))
+        np.testing.assert_array_equal(np.asarray(result), arr)
+
+
+class TestDenoiseFallback:
+    """Tests for the median filter fallbacks"""
+
+    def test_numpy_fallback_supports_large_kernels(self):
+        """Kernels above 5x5 fall back to uint8 instead of silently no-op"""
+        img = np.full((32, 32, 3), 0.5, dtype=np.float32)
+        img[16, 16] = 1.0  # isolated hot pixel
+
+        with patch.object(
+            pynegative.core.cv2, "bilateralFilter", side_effect=RuntimeError
+        ):
+            result = pynegative.de_noise_image(img, 40)
+
+        assert result.dtype == np.float32
+        assert result[16, 16, 0] == pytest.approx(0.5, abs=1 / 255)
+
+
+class TestDenoiseChroma:
+    def test_half_res_chroma_removes_colour_noise(self):
+        if pynegative.core.cv2 is None:
+            pytest.skip("OpenCV not installed")
+        rng = np.random.default_rng(0)
+        noise = rng.normal(0, 0.05, (128, 160, 3)).astype(np.float32)
+        img = np.clip(0.5 + noise, 0, 1)
+
+        with patch.object(
+            pynegative.core.cv2,
+            "bilateralFilter",
+            wraps=pynegative.core.cv2.bilateralFilter,
+        ) as bilateral:
+            result = pynegative.de_noise_image(img, 30)
+
+        chroma_shapes = [c.args[0].shape for c in bilateral.call_args_list[:2]]
+        assert chroma_shapes == [(64, 80), (64, 80)]
+        assert result.shape == img.shape
+        chroma = result - result.mean(axis=2, keepdims=True)
+        noisy_chroma = img - img.mean(axis=2, keepdims=True)
+        assert chroma.std() < noisy_chroma.std() / 2
+
 
 class TestSaveImage:
     """Tests for the save_image function"""
@@ -48,6 +213,38 @@ class TestSaveImage:
             pynegative.save_image(pil_img, output_path)
             assert output_path.exists()
 
+    def test_save_jpeg_falls_back_to_pillow(self):
+        with tempfile.TemporaryDirectory() as tmpdir:
+            output_path = Path(tmpdir) / "test.jpg"
+            pil_img = Image.new("RGB", (16, 16), color=(255, 0, 0))
+
+            with (
+                patch.object(pynegative.core, "_TURBOJPEG", None),
+                patch.object(pil_img, "save") as save,
+            ):
+                pynegative.save_image(pil_img, output_path, quality=90)
+
+            save.assert_called_once_with(output_path, quality=90)
+
+    def test_save_jpeg_prefers_turbojpeg(self):
+        with tempfile.TemporaryDirectory() as tmpdir:
+            output_path = Path(tmpdir) / "test.jpg"
+            pil_img = Image.new("RGB", (16, 16), color=(255, 0, 0))
+            turbo = MagicMock()
+            turbo.encode.return_value = b"encoded"
+
+            with (
+                patch.object(pynegative.core, "_TURBOJPEG", turbo),
+                patch.object(pynegative.core, "TJPF_RGB", 0, create=True),
+                patch.object(pynegative.core, "TJSAMP_420", 2, create=True),
+            ):
+                pynegative.save_image(pil_img, output_path, quality=90)
+
+            pixels = turbo.encode.call_args[0][0]
+            assert pixels.shape == (16, 16, 3)
+            assert turbo.encode.call_args[1]["quality"] == 90
+            assert output_path.read_bytes() == b"encoded"
+
     def test_save_heif_not_supported(self):
         with tempfile.TemporaryDirectory() as tmpdir:
             tmpdir = Path(tmpdir)
@@ -60,3 +257,499 @@ class TestSaveImage:
                     RuntimeError, match="HEIF requested but pillow-heif not installed"
                 ):
                     pynegative.save_image(pil_img, output_path)
+
+
+class TestFloatToUint8:
+    """Tests for the float_to_uint8 conversion helper"""
+
+    def test_matches_astype_conversion(self):
+        img = np.random.rand(16, 16, 3).astype(np.float32)
+        result = pynegative.core.float_to_uint8(img)
+        assert result.dtype == np.uint8
+        np.testing.assert_array_equal(result, (img * 255).astype(np.uint8))
+
+    def test_writes_into_provided_buffer(self):
+        img = np.full((4, 4, 3), 1.0, dtype=np.float32)
+        out = np.zeros((4, 4, 3), dtype=np.uint8)
+        result = pynegative.core.float_to_uint8(img, out=out)
+        assert result is out
+        assert np.all(out == 255)
+
+    def test_uint16_matches_astype_conversion(self):
+        img = np.random.rand(16, 16, 3).astype(np.float32)
+        result = pynegative.core.float_to_uint16(img)
+        assert result.dtype == np.uint16
+        np.testing.assert_array_equal(result, (img * 65535).astype(np.uint16))
+
+    def test_uint_to_float_matches_astype_division(self):
+        img = np.random.randint(0, 65536, (16, 16, 3)).astype(np.uint16)
+        result = pynegative.core.uint_to_float(img, 65535.0)
+        assert result.dtype == np.float32
+        np.testing.assert_array_equal(result, img.astype(np.float32) / 65535.0)
+
+
+class TestOpenRawCache:
+    """Tests for the size-bounded open_raw cache"""
+
+    def test_evicts_least_recently_used_by_bytes(self):
+        cache = pynegative.core._BytesLRU(cap_bytes=250)
+        cache.put("a", np.zeros(100, dtype=np.uint8))
+        cache.put("b", np.zeros(100, dtype=np.uint8))
+        cache.get("a")
+        cache.put("c", np.zeros(100, dtype=np.uint8))
+        assert cache.get("b") is None
+        assert cache.get("a") is not None
+        assert cache.cur_bytes == 200
+
+    def test_reopen_skips_libraw(self):
+        """Reopening an unchanged file is served without decoding again"""
+        with tempfile.TemporaryDirectory() as tmpdir:
+            path = Path(tmpdir) / "photo.png"
+            Image.new("RGB", (8, 8), color=(0, 255, 0)).save(path)
+
+            with patch.object(
+                pynegative.core,
+                "_decode_image",
+                wraps=pynegative.core._decode_image,
+            ) as decode:
+                pynegative.open_raw(path, half_size=True)
+                pynegative.open_raw(path, half_size=True)
+                pynegative.open_raw(path)
+
+            assert decode.call_count == 2
+
+    def test_equivalent_paths_share_an_entry(self):
+        with tempfile.TemporaryDirectory() as tmpdir:
+            path = Path(tmpdir) / "photo.png"
+            Image.new("RGB", (8, 8), color=(0, 255, 0)).save(path)
+            alias = Path(tmpdir) / "link.png"
+            alias.symlink_to(path)
+
+            with patch.object(
+                pynegative.core,
+                "_decode_image",
+                wraps=pynegative.core._decode_image,
+            ) as decode:
+                pynegative.open_raw(path)
+                pynegative.open_raw(str(path))
+                pynegative.open_raw(Path(tmpdir) / "." / "photo.png")
+                pynegative.open_raw(alias)
+
+            assert decode.call_count == 1
+
+    def test_raw_redecode_reuses_unpacked_handle(self):
+        """A second decode at another size reuses the unpacked LibRaw handle"""
+        raw = MagicMock()
+        raw.postprocess.return_value = np.zeros((4, 6, 3), dtype=np.uint8)
+        with tempfile.TemporaryDirectory() as tmpdir:
+            path = Path(tmpdir) / "photo.cr2"
+            path.write_bytes(bytes(64))
+
+            with (
+                patch.object(
+                    pynegative.core.rawpy, "imread", return_value=raw
+                ) as imread,
+                patch.dict(pynegative.core._RAW_HANDLES, clear=True),
+            ):
+                pynegative.open_raw(path, half_size=True)
+                pynegative.open_raw(path)
+
+        imread.assert_called_once()
+        raw.unpack.assert_called_once()
+        half_sizes = [c.kwargs["half_size"] for c in raw.postprocess.call_args_list]
+        assert half_sizes == [True, False]
+
+    def test_raw_handles_are_closed_on_eviction_and_clear(self):
+        """Dropped LibRaw handles are closed so their files are released"""
+        handles = {}
+
+        def imread(file):
+            handles[file.name] = MagicMock()
+            return handles[file.name]
+
+        with tempfile.TemporaryDirectory() as tmpdir:
+            first = Path(tmpdir) / "first.cr2"
+            second = Path(tmpdir) / "second.cr2"
+            first.write_bytes(bytes(64))
+            second.write_bytes(bytes(64))
+
+            with (
+                patch.object(pynegative.core.rawpy, "imread", side_effect=imread),
+                patch.object(pynegative.core, "RAW_HANDLE_CACHE_SIZE", 1),
+                patch.dict(pynegative.core._RAW_HANDLES, clear=True),
+            ):
+                with pynegative.core._unpacked_raw(first):
+                    pass
+                handles[str(first)].close.assert_not_called()
+
+                with pynegative.core._unpacked_raw(second):
+                    pass
+                handles[str(first)].close.assert_called_once()
+                handles[str(second)].close.assert_not_called()
+
+                pynegative.open_raw.cache_clear()
+                handles[str(second)].close.assert_called_once()
+                assert not pynegative.core._RAW_HANDLES
+
+    def test_evicted_handle_in_use_is_closed_after_release(self):
+        """Eviction never closes a handle another decode is still using"""
+        handles = {}
+
+        def imread(file):
+            handles[file.name] = MagicMock()
+            return handles[file.name]
+
+        with tempfile.TemporaryDirectory() as tmpdir:
+            first = Path(tmpdir) / "first.cr2"
+            second = Path(tmpdir) / "second.cr2"
+            first.write_bytes(bytes(64))
+            second.write_bytes(bytes(64))
+
+            with (
+                patch.object(pynegative.core.rawpy, "imread", side_effect=imread),
+                patch.object(pynegative.core, "RAW_HANDLE_CACHE_SIZE", 1),
+                patch.dict(pynegative.core._RAW_HANDLES, clear=True),
+            ):
+                with pynegative.core._unpacked_raw(first):
+                    with pynegative.core._unpacked_raw(second):
+                        pass
+                    handles[str(first)].close.assert_not_called()
+                handles[str(first)].close.assert_called_once()
+                handles[str(second)].close.assert_not_called()
+
+    def test_raw_decodes_of_different_files_run_concurrently(self):
+        """Decodes of different RAWs overlap instead of queueing on the cache"""
+        decoding = threading.Barrier(3, timeout=5)
+
+        def imread(file):
+            raw = MagicMock()
+
+            def postprocess(**kwargs):
+                # Only returns once all three decodes are in flight together
+                decoding.wait()
+                return np.zeros((4, 6, 3), dtype=np.uint8)
+
+            raw.postprocess.side_effect = postprocess
+            return raw
+
+        with tempfile.TemporaryDirectory() as tmpdir:
+            paths = [Path(tmpdir) / f"photo_{i}.cr2" for i in range(3)]
+            for path in paths:
+                path.write_bytes(bytes(64))
+
+            with (
+                patch.object(pynegative.core.rawpy, "imread", side_effect=imread),
+                patch.dict(pynegative.core._RAW_HANDLES, clear=True),
+                ThreadPoolExecutor(max_workers=3) as pool,
+            ):
+                results = list(
+                    pool.map(
+                        lambda path: pynegative.core._decode_image(path, False, 8),
+                        paths,
+                    )
+                )
+
+        assert all(rgb.shape == (4, 6, 3) for rgb, _ in results)
+
+    def test_raw_handle_closed_when_unpack_fails(self):
+        raw = MagicMock()
+        raw.unpack.side_effect = RuntimeError("corrupt")
+        with tempfile.TemporaryDirectory() as tmpdir:
+            path = Path(tmpdir) / "broken.cr2"
+            path.write_bytes(bytes(64))
+
+            with (
+                patch.object(pynegative.core.rawpy, "imread", return_value=raw),
+                patch.dict(pynegative.core._RAW_HANDLES, clear=True),
+            ):
+                with pytest.raises(RuntimeError):
+                    with pynegative.core._unpacked_raw(path):
+                        pass
+                assert not pynegative.core._RAW_HANDLES
+
+        raw.close.assert_called_once()
+
+    def test_cache_clear_forces_a_new_decode(self):
+        with tempfile.TemporaryDirectory() as tmpdir:
+            path = Path(tmpdir) / "photo.png"
+            Image.new("RGB", (8, 8), color=(0, 255, 0)).save(path)
+
+            with patch.object(
+                pynegative.core,
+                "_decode_image",
+                wraps=pynegative.core._decode_image,
+            ) as decode:
+                pynegative.open_raw(path)
+                pynegative.open_raw.cache_clear()
+                pynegative.open_raw(path)
+
+            assert decode.call_count == 2
+
+    def test_reloads_when_file_changes(self):
+        with tempfile.TemporaryDirectory() as tmpdir:
+            path = Path(tmpdir) / "photo.png"
+            Image.new("RGB", (8, 8), color=(255, 0, 0)).save(path)
+            first = pynegative.open_raw(path)
+            first[:] = 0  # callers get their own float copy
+            assert pynegative.open_raw(path)[0, 0, 0] == 1.0
+
+            Image.new("RGB", (8, 8), color=(0, 0, 255)).save(path)
+            stat = path.stat()
+            os.utime(path, ns=(stat.st_atime_ns, stat.st_mtime_ns + 10**9))
+            assert pynegative.open_raw(path)[0, 0, 2] == 1.0
+
+
+class TestSequentialRead:
+    """Tests for the page-cache hints around RAW reads"""
+
+    @pytest.mark.skipif(
+        not hasattr(os, "posix_fadvise"), reason="posix_fadvise unavailable"
+    )
+    def test_advises_the_descriptor_libraw_reads(self):
+        """The sequential hint lands on the file handed to rawpy, not a side fd"""
+        raw = MagicMock()
+        read_fds = []
+
+        def imread(file):
+            read_fds.append(file.fileno())
+            return raw
+
+        with tempfile.TemporaryDirectory() as tmpdir:
+            path = Path(tmpdir) / "photo.nef"
+            path.write_bytes(bytes(64))
+
+            with (
+                patch.object(pynegative.core.os, "posix_fadvise") as fadvise,
+                patch.object(pynegative.core.rawpy, "imread", side_effect=imread),
+            ):
+                pynegative.core._read_unpacked(str(path))
+
+        fadvise.assert_called_once_with(read_fds[0], 0, 0, os.POSIX_FADV_SEQUENTIAL)
+        raw.unpack.assert_called_once()
+
+    def test_missing_file_raises(self):
+        with pytest.raises(FileNotFoundError):
+            with pynegative.core._sequential_read("/nonexistent/photo.nef"):
+                pass
+
+
+class TestDraftDecoding:
+    """Tests for reduced-scale JPEG decoding"""
+
+    def _write_jpeg(self, tmpdir, size=(800, 600)):
+        path = Path(tmpdir) / "photo.jpg"
+        Image.new("RGB", size, color=(10, 120, 200)).save(path, quality=90)
+        return path
+
+    def test_open_raw_half_size_jpeg(self):
+        with tempfile.TemporaryDirectory() as tmpdir:
+            path = self._write_jpeg(tmpdir)
+            img = pynegative.core.open_raw(path, half_size=True)
+            assert img.shape == (300, 400, 3)
+            assert img.dtype == np.float32
+
+    def test_open_raw_half_size_png_averages_blocks(self):
+        pixels = np.random.default_rng(0).integers(0, 256, (60, 80, 3), np.uint8)
+        with tempfile.TemporaryDirectory() as tmpdir:
+            path = Path(tmpdir) / "photo.png"
+            Image.fromarray(pixels).save(path)
+            img = pynegative.core.open_raw(path, half_size=True)
+
+        assert img.shape == (30, 40, 3)
+        blocks = pixels.reshape(30, 2, 40, 2, 3).mean(axis=(1, 3)) / 255.0
+        np.testing.assert_allclose(img, blocks, atol=1 / 255.0 + 1e-6)
+
+    def test_open_raw_full_jpeg_matches_pillow_orientation(self):
+        pixels = np.zeros((40, 60, 3), dtype=np.uint8)
+        pixels[:10, :10] = (255, 0, 0)
+        exif = Image.Exif()
+        exif[274] = 6  # rotate 90 CW on display
+        with tempfile.TemporaryDirectory() as tmpdir:
+            path = Path(tmpdir) / "photo.jpg"
+            Image.fromarray(pixels).save(path, exif=exif, quality=95)
+            img = pynegative.core.open_raw(path)
+            with Image.open(path) as pil_img:
+                expected = np.asarray(ImageOps.exif_transpose(pil_img))
+
+        assert img.shape == (60, 40, 3)
+        np.testing.assert_allclose(img, expected / 255.0, atol=1 / 255.0)
+
+    def test_open_raw_many_keeps_order(self):
+        with tempfile.TemporaryDirectory() as tmpdir:
+            paths = []
+            for i, size in enumerate(((80, 60), (40, 30), (64, 64))):
+                path = Path(tmpdir) / f"photo{i}.png"
+                Image.new("RGB", size, color=(i, 0, 0)).save(path)
+                paths.append(path)
+            images = pynegative.core.open_raw_many(paths)
+            assert [img.shape for img in images] == [
+                (60, 80, 3),
+                (30, 40, 3),
+                (64, 64, 3),
+            ]
+            assert images[2][0, 0, 0] == np.float32(2 / 255.0)
+
+    def test_fast_preview_scan_picks_smallest_covering_jpeg(self):
+        def jpeg_bytes(size, color):
+            buf = BytesIO()
+            Image.new("RGB", size, color=color).save(buf, "JPEG")
+            return buf.getvalue()
+
+        with tempfile.TemporaryDirectory() as tmpdir:
+            path = Path(tmpdir) / "photo.nef"
+            path.write_bytes(
+                b"II*\x00"
+                + bytes(1000)
+                + b"\xff\xd8\xff\x00 SOI-like bytes in compressed RAW data"
+                + jpeg_bytes((160, 120), (255, 0, 0))
+                + jpeg_bytes((1600, 1200), (0, 255, 0))
+                + jpeg_bytes((800, 600), (0, 0, 255))
+                + bytes(1000)
+            )
+
+            with (
+                patch.object(pynegative.core.rawpy, "imread") as imread,
+                patch.object(
+                    pynegative.core.Image, "open", wraps=Image.open
+                ) as pil_open,
+            ):
+                thumb = pynegative.extract_thumbnail(path, size=400)
+                imread.assert_not_called()
+                # Candidate sizes come from their headers; only one is opened
+                assert pil_open.call_count == 1
+            assert thumb.size == (800, 600)
+            assert thumb.getpixel((10, 10))[2] > 200
+
+            assert pynegative.core._fast_jpeg_preview(path, 2000) is None
+
+    def test_extract_thumbnail_with_size_uses_draft(self):
+        with tempfile.TemporaryDirectory() as tmpdir:
+            path = self._write_jpeg(tmpdir)
+            full = pynegative.extract_thumbnail(path)
+            small = pynegative.extract_thumbnail(path, size=100)
+            assert full.size == (800, 600)
+            # Decoded at 1/4 scale: the smallest scale still covering 100x100
+            assert small.size == (200, 150)
+
+
+class TestCaptureDate:
+    @staticmethod
+    def _exif(original=None, modified=None):
+        exif = Image.Exif()
+        if modified:
+            exif[306] = modified
+        if original:
+            exif.get_ifd(0x8769)[36867] = original
+        return exif
+
+    def test_jpeg_reads_date_time_original(self):
+        with tempfile.TemporaryDirectory() as tmpdir:
+            path = Path(tmpdir) / "photo.jpg"
+            exif = self._exif("2019:05:06 07:08:09", "2020:01:02 03:04:05")
+            Image.new("RGB", (8, 8)).save(path, exif=exif)
+            assert pynegative.core.get_exif_capture_date(path) == "2019-05-06"
+
+    def test_raw_parses_embedded_tiff_without_libraw(self):
+        buf = BytesIO()
+        exif = self._exif("2018:03:04 10:11:12")
+        Image.new("RGB", (8, 8)).save(buf, "JPEG", exif=exif)
+        with tempfile.TemporaryDirectory() as tmpdir:
+            path = Path(tmpdir) / "photo.raf"
+            path.write_bytes(b"FUJIFILMCCD-RAW " + bytes(100) + buf.getvalue())
+
+            with patch.object(pynegative.core.rawpy, "imread") as imread:
+                date = pynegative.core.get_exif_capture_date(path)
+                imread.assert_not_called()
+            assert date == "2018-03-04"
+
+    @pytest.mark.parametrize(
+        "magic, suffix", [(b"IIRO", ".orf"), (b"IIRS", ".orf"), (b"IIU\x00", ".rw2")]
+    )
+    def test_raw_with_vendor_tiff_magic(self, magic, suffix):
+        """Olympus and Panasonic headers are read as TIFF despite their magic"""
+        exif = self._exif("2017:02:03 04:05:06")
+        exif.endian = "<"  # Both vendors write little-endian TIFF
+        tiff = exif.tobytes().removeprefix(b"Exif\x00\x00")
+        assert tiff[:4] == b"II*\x00"
+        # A decoy embedded JPEG with another date must not be picked instead
+        decoy = BytesIO()
+        Image.new("RGB", (8, 8)).save(
+            decoy, "JPEG", exif=self._exif("2001:01:01 00:00:00")
+        )
+        with tempfile.TemporaryDirectory() as tmpdir:
+            path = Path(tmpdir) / f"photo{suffix}"
+            path.write_bytes(magic + tiff[4:] + bytes(100) + decoy.getvalue())
+            assert pynegative.core.get_exif_capture_date(path) == "2017-02-03"
+
+    def test_repeat_lookups_are_cached_until_the_file_changes(self):
+        with tempfile.TemporaryDirectory() as tmpdir:
+            path = Path(tmpdir) / "photo.jpg"
+            Image.new("RGB", (8, 8)).save(path, exif=self._exif("2019:05:06 07:08:09"))
+
+            with patch.object(
+                pynegative.core, "_exif_date", wraps=pynegative.core._exif_date
+            ) as parse:
+                pynegative.core.get_exif_capture_date(path)
+                pynegative.core.get_exif_capture_date(str(path))
+                assert parse.call_count == 1
+
+                Image.new("RGB", (8, 8)).save(
+                    path, exif=self._exif("2021:07:08 09:10:11")
+                )
+                stat = path.stat()
+                os.utime(path, ns=(stat.st_atime_ns, stat.st_mtime_ns + 10**9))
+                assert pynegative.core.get_exif_capture_date(path) == "2021-07-08"
+                assert parse.call_count == 2
+
+    def test_raw_without_exif_falls_back_to_mtime(self):
+        with tempfile.TemporaryDirectory() as tmpdir:
+            path = Path(tmpdir) / "photo.cr2"
+            path.write_bytes(bytes(100))
+            os.utime(path, (0, 1_600_000_000))
+            expected = pynegative.core.format_date(1_600_000_000)
+            assert pynegative.core.get_exif_capture_date(path) == expected
+
+
+class TestGeometry:
+    @pytest.mark.parametrize("angle", [3.37, -12.5, 45.0, 90.0])
+    def test_opencv_rotation_matches_pil(self, angle):
+        if pynegative.core.cv2 is None:
+            pytest.skip("OpenCV not installed")
+        y, x = np.mgrid[0:120, 0:160]
+        gradient = (128 + 60 * np.sin(x / 9.0) * np.cos(y / 7.0)).astype(np.uint8)
+        img = Image.fromarray(np.dstack([gradient] * 3))
+
+        expected = img.rotate(angle, resample=Image.BICUBIC, expand=True)
+        rotated = pynegative.core.apply_geometry(img, rotate=angle)
+
+        assert rotated.size == expected.size
+        diff = np.abs(
+            np.asarray(rotated, dtype=np.int16) - np.asarray(expected, dtype=np.int16)
+        )
+        assert diff[10:-10, 10:-10].mean() < 1.5
+
+    @pytest.mark.parametrize(
+        "flip_h, flip_v", [(True, False), (False, True), (True, True)]
+    )
+    def test_flips_fold_into_the_rotation(self, flip_h, flip_v):
+        if pynegative.core.cv2 is None:
+            pytest.skip("OpenCV not installed")
+        y, x = np.mgrid[0:90, 0:140]
+        gradient = (128 + 60 * np.sin(x / 11.0) * np.cos(y / 5.0)).astype(np.uint8)
+        img = Image.fromarray(np.dstack([gradient, gradient // 2, 255 - gradient]))
+
+        flipped = img
+        if flip_h:
+            flipped = flipped.transpose(Image.FLIP_LEFT_RIGHT)
+        if flip_v:
+            flipped = flipped.transpose(Image.FLIP_TOP_BOTTOM)
+        expected = pynegative.core.apply_geometry(flipped, rotate=7.5)
+        result = pynegative.core.apply_geometry(
+            img, rotate=7.5, flip_h=flip_h, flip_v=flip_v
+        )
+
+        assert result.size == expected.size
+        diff = np.abs(
+            np.asarray(result, dtype=np.int16) - np.asarray(expected, dtype=np.int16)
+        )
+        assert diff.max() <= 1
@@ -6,6 +6,7 @@ from pathlib import Path
 import json
 import tempfile
 import time
+from unittest.mock import patch
 
 from pynegative import core
 
@@ -126,6 +127,49 @@ class TestSidecars:
         # 'rating' should be added by save_sidecar and load_sidecar if missing
         assert loaded_settings == {"rating": 0}
 
+    def test_save_sidecar_without_orjson(self, temp_raw_path):
+        """The stdlib json fallback writes an equivalent, readable sidecar."""
+        settings = {"exposure": 0.25, "crop": [0.1, 0.1, 0.9, 0.9], "rating": 1}
+        with patch.object(core, "orjson", None):
+            core.save_sidecar(temp_raw_path, settings)
+
+        data = json.loads(core.get_sidecar_path(temp_raw_path).read_text())
+        assert data["settings"] == settings
+        assert core.load_sidecar(temp_raw_path) == settings
+        with patch.object(core, "orjson", None):
+            assert core.load_sidecar(temp_raw_path) == settings
+
+    def test_save_sidecar_is_atomic(self, temp_raw_path, temp_sidecar_dir):
+        """A failed write leaves the previous sidecar intact and no temp file."""
+        core.save_sidecar(temp_raw_path, {"exposure": 0.5})
+        assert [p.name for p in temp_sidecar_dir.iterdir()] == [
+            f"{temp_raw_path.name}.json"
+        ]
+
+        with patch.object(core.os, "replace", side_effect=OSError("disk full")):
+            with pytest.raises(OSError):
+                core.save_sidecar(temp_raw_path, {"exposure": 1.0})
+
+        assert core.load_sidecar(temp_raw_path)["exposure"] == 0.5
+        assert not list(temp_sidecar_dir.glob("*.tmp"))
+
+    def test_load_sidecars_for_dir(self, temp_raw_path, temp_sidecar_dir):
+        """All sidecars of a folder load in one call, keyed by image name."""
+        other_raw = temp_raw_path.parent / "other.nef"
+        core.save_sidecar(temp_raw_path, {"exposure": 0.5})
+        core.save_sidecar(other_raw, {"rating": 3})
+        (temp_sidecar_dir / "broken.cr2.json").write_text("{not json")
+
+        sidecars = core.load_sidecars_for_dir(temp_raw_path.parent)
+
+        assert sidecars == {
+            temp_raw_path.name: core.load_sidecar(temp_raw_path),
+            "other.nef": {"rating": 3},
+        }
+
+    def test_load_sidecars_for_dir_without_sidecars(self, temp_raw_path):
+        assert core.load_sidecars_for_dir(temp_raw_path.parent) == {}
+
     def test_rename_sidecar(self, temp_raw_path):
         """Test renaming a sidecar file."""
         old_raw = temp_raw_path
@@ -3,8 +3,10 @@
 
 import pytest
 import numpy as np
+from unittest.mock import patch
 
 import pynegative
+from pynegative import core
 
 
 class TestApplyToneMap:
@@ -24,6 +26,42 @@ class TestApplyToneMap:
         np.testing.assert_array_almost_equal(result, img)
         assert stats["mean"] == pytest.approx(0.6)
 
+    def test_identity_fast_path(self):
+        """Default settings clip into a new array and still report clipping"""
+        img = np.array([[[-0.5, 0.5, 1.5], [0.2, 0.4, 0.6]]], dtype=np.float64)
+
+        result, stats = pynegative.apply_tone_map(img)
+
+        assert result is not img
+        np.testing.assert_array_equal(result, np.clip(img, 0, 1))
+        assert img[0, 0, 0] == -0.5
+        assert stats["pct_shadows_clipped"] == pytest.approx(100 / 6)
+        assert stats["pct_highlights_clipped"] == pytest.approx(100 / 6)
+        assert stats["mean"] == pytest.approx(img.mean())
+
+    @pytest.mark.parametrize("numba", [True, False])
+    @pytest.mark.parametrize(
+        "settings",
+        [
+            {},
+            {"exposure": 0.5},
+            {"temperature": 0.3, "shadows": 0.2, "saturation": 1.2},
+        ],
+    )
+    def test_writes_into_out_buffer(self, numba, settings):
+        """A caller-provided buffer receives the result; the input is untouched"""
+        img = np.random.default_rng(0).random((8, 12, 3), dtype=np.float32)
+        original = img.copy()
+        expected, _ = pynegative.apply_tone_map(img, **settings)
+
+        out = np.full_like(img, -1.0)
+        with patch.object(core, "NUMBA_AVAILABLE", numba and core.NUMBA_AVAILABLE):
+            result, _ = pynegative.apply_tone_map(img, **settings, out=out)
+
+        assert result is out
+        np.testing.assert_allclose(out, expected, atol=1e-5)
+        np.testing.assert_array_equal(img, original)
+
     def test_exposure_adjustment(self):
         """Test exposure adjustment (+1 stop)"""
         img = np.array([[[0.5, 0.5, 0.5]]], dtype=np.float32)
@@ -61,6 +99,18 @@ class TestApplyToneMap:
         # Highlights (0.8) should be reduced
         assert result[0, 1, 0] < 0.8
 
+    def test_shadow_highlight_mask_values(self):
+        """Masks are squared luminance terms: (1 - lum)^2 and lum^2"""
+        img = np.array([[[0.2, 0.2, 0.2], [0.8, 0.8, 0.8]]], dtype=np.float32)
+
+        lifted, _ = pynegative.apply_tone_map(img, shadows=0.2)
+        recovered, _ = pynegative.apply_tone_map(img, highlights=-0.2)
+        boosted, _ = pynegative.apply_tone_map(img, highlights=0.5)
+
+        assert lifted[0, 0, 0] == pytest.approx(0.2 * (1 + 0.2 * 0.8**2), rel=1e-4)
+        assert recovered[0, 1, 0] == pytest.approx(0.8 / (1 + 0.2 * 0.8**2), rel=1e-4)
+        assert boosted[0, 1, 0] == pytest.approx(0.8 * 0.68 + 0.32, rel=1e-4)
+
     def test_clipping_statistics(self):
         """Test that clipping statistics are calculated correctly"""
         img = np.array([[[1.5, -0.5, 0.5]]], dtype=np.float32)
@@ -108,6 +158,128 @@ class TestApplyToneMap:
         assert np.all(np.isfinite(result))
 
 
+class TestToneMapKernels:
+    """Tests that the Numba kernels match the NumPy reference path"""
+
+    @pytest.mark.parametrize(
+        "params",
+        [
+            {"blacks": 0.05, "whites": 0.9},
+            {"blacks": 0.1},
+            {"shadows": 0.4},
+            {"highlights": -0.5},
+            {"highlights": 0.3, "shadows": -0.2, "whites": 1.2},
+            {"exposure": 0.8, "contrast": 1.3, "saturation": 1.4},
+            {"temperature": 0.4, "tint": -0.3, "saturation": 0.5},
+            {
+                "exposure": -0.5,
+                "contrast": 0.8,
+                "blacks": 0.02,
+                "whites": 0.95,
+                "shadows": 0.3,
+                "highlights": -0.4,
+                "saturation": 1.2,
+                "temperature": -0.2,
+                "tint": 0.1,
+            },
+        ],
+    )
+    def test_tone_map_matches_numpy(self, params):
+        pytest.importorskip("numba")
+        rng = np.random.default_rng(0)
+        img = rng.uniform(-0.1, 1.4, (32, 24, 3)).astype(np.float32)
+
+        fused, fused_stats = pynegative.apply_tone_map(img, **params)
+        with patch.object(core, "NUMBA_AVAILABLE", False):
+            reference, reference_stats = pynegative.apply_tone_map(img, **params)
+
+        np.testing.assert_allclose(fused, reference, atol=1e-5)
+        for key in reference_stats:
+            assert fused_stats[key] == pytest.approx(reference_stats[key], abs=1e-4)
+
+    def test_kernel_without_stats_matches(self):
+        pytest.importorskip("numba")
+        rng = np.random.default_rng(0)
+        img = rng.uniform(-0.1, 1.4, (32, 24, 3)).astype(np.float32)
+        with_stats, without_stats = np.empty_like(img), np.empty_like(img)
+
+        counts = core._fused_tone_map(img, with_stats, exposure=0.5, shadows=0.2)
+        skipped = core._fused_tone_map(
+            img, without_stats, exposure=0.5, shadows=0.2, with_stats=False
+        )
+
+        np.testing.assert_array_equal(with_stats, without_stats)
+        assert counts[1] > 0
+        assert skipped == (0, 0, 0.0)
+
+    @pytest.mark.skipif(not core.CUPY_AVAILABLE, reason="needs CuPy and a CUDA GPU")
+    def test_gpu_tone_map_matches_numpy(self):
+        params = {"exposure": 0.3, "blacks": 0.02, "shadows": 0.3, "highlights": -0.4}
+        rng = np.random.default_rng(0)
+        img = rng.uniform(-0.1, 1.4, (32, 24, 3)).astype(np.float32)
+
+        with patch.object(core, "GPU_MIN_SIZE", 0):
+            gpu, gpu_stats = pynegative.apply_tone_map(img, **params)
+        with patch.object(core, "NUMBA_AVAILABLE", False):
+            reference, reference_stats = pynegative.apply_tone_map(img, **params)
+
+        np.testing.assert_allclose(gpu, reference, atol=1e-5)
+        for key in reference_stats:
+            assert gpu_stats[key] == pytest.approx(reference_stats[key], abs=1e-4)
+
+    def test_small_images_stay_on_cpu(self):
+        img = np.zeros((32, 24, 3), dtype=np.float32)
+        with patch.object(core, "CUPY_AVAILABLE", True):
+            assert not core._can_gpu_tone_map(img)
+
+
+class TestToneLut:
+    """Tests for the per-channel tone LUT fast path"""
+
+    def test_lut_matches_float_pipeline(self):
+        params = {
+            "exposure": 0.7,
+            "contrast": 1.2,
+            "blacks": 0.02,
+            "whites": 0.95,
+            "temperature": 0.3,
+            "tint": -0.1,
+        }
+        rng = np.random.default_rng(1)
+        img_u8 = rng.integers(0, 256, (20, 30, 3), dtype=np.uint8)
+
+        lut = core.build_tone_lut(**params)
+        result = core.apply_tone_lut(img_u8, lut)
+
+        expected, _ = pynegative.apply_tone_map(
+            img_u8.astype(np.float32) / 255.0, **params, calculate_stats=False
+        )
+        assert result.dtype == np.uint8
+        np.testing.assert_allclose(
+            result, core.float_to_uint8(expected), atol=1, rtol=0
+        )
+
+    def test_numpy_lut_matches_opencv(self):
+        pytest.importorskip("cv2")
+        rng = np.random.default_rng(2)
+        img_u8 = rng.integers(0, 256, (20, 30, 3), dtype=np.uint8)
+        lut = core.build_tone_lut(exposure=0.4, temperature=0.2)
+
+        expected = core.apply_tone_lut(img_u8, lut)
+        out = np.zeros_like(img_u8)
+        with patch.object(core, "cv2", None):
+            result = core.apply_tone_lut(img_u8, lut, out=out)
+
+        assert result is out
+        np.testing.assert_array_equal(result, expected)
+
+    def test_lut_compatibility(self):
+        assert core.is_tone_lut_compatible()
+        assert not core.is_tone_lut_compatible(shadows=0.1)
+        assert not core.is_tone_lut_compatible(highlights=-0.1)
+        assert not core.is_tone_lut_compatible(saturation=1.05)
+
+
 class TestCalculateAutoExposure:
     """Tests for auto-exposure calculation"""
 
@@ -139,3 +311,89 @@ class TestCalculateAutoExposure:
         normal_img = np.full((10, 10, 3), 0.18, dtype=np.float32)
         normal_settings = pynegative.calculate_auto_exposure(normal_img)
         assert settings["exposure"] < normal_settings["exposure"]
+
+    def test_large_image_is_sampled(self):
+        """Sampling a strided view lands on the full-resolution answer"""
+        rng = np.random.default_rng(0)
+        img = (rng.random((1200, 1600, 3), dtype=np.float32) ** 3) * 0.2
+        full_p98 = np.percentile(core._luminance(img), 98)
+
+        with patch.object(core, "_luminance", wraps=core._luminance) as lum:
+            settings = pynegative.calculate_auto_exposure(img)
+
+        assert lum.call_args[0][0].size <= img.size / 4
+        assert settings["exposure"] == pytest.approx(np.log2(0.85 / full_p98), abs=0.02)
+
+
+class TestCalculateAutoWB:
+    def test_large_image_is_sampled(self):
+        """Gray-world means from the sample match the full-resolution answer"""
+        rng = np.random.default_rng(0)
+        img = rng.random((1200, 1600, 3), dtype=np.float32)
+        img *= np.array([0.6, 0.5, 0.3], dtype=np.float32)
+        means = img.reshape(-1, 3).mean(axis=0)
+
+        settings = core.calculate_auto_wb(img)
+
+        assert settings["temperature"] == pytest.approx(
+            np.log(means[2] / means[0]) / 0.8, abs=0.01
+        )
+        assert core._auto_sample(img).size <= img.size / 4
+
+
+class TestProcessToUint:
+    def test_process_to_uint8_matches_tone_map(self):
+        img = np.random.rand(16, 24, 3).astype(np.float32)
+        settings = {"exposure": 0.3, "contrast": 1.2, "saturation": 1.1}
+
+        expected, _ = core.apply_tone_map(img, **settings)
+        out = np.empty(img.shape, dtype=np.uint8)
+        result = core.process_to_uint8(img, settings, out=out)
+
+        assert result is out
+        np.testing.assert_array_equal(result, (expected * 255).astype(np.uint8))
+
+    def test_fused_integer_output_matches_numpy(self):
+        pytest.importorskip("numba")
+        rng = np.random.default_rng(2)
+        img = rng.uniform(-0.1, 1.3, (20, 16, 3)).astype(np.float32)
+        settings = {"exposure": 0.4, "shadows": 0.2, "saturation": 0.8}
+
+        fused8 = core.process_to_uint8(img, settings)
+        fused16 = core.process_to_uint16(img, settings)
+        with patch.object(core, "NUMBA_AVAILABLE", False):
+            ref8 = core.process_to_uint8(img, settings)
+            ref16 = core.process_to_uint16(img, settings)
+
+        assert np.abs(fused8.astype(int) - ref8).max() <= 1
+        assert np.abs(fused16.astype(int) - ref16).max() <= 2
+
+    def test_process_to_uint16_defaults_are_identity(self):
+        img = np.random.rand(8, 8, 3).astype(np.float32)
+        result = core.process_to_uint16(img, {})
+
+        assert result.dtype == np.uint16
+        np.testing.assert_array_equal(result, (img * 65535).astype(np.uint16))
+
+
+class TestLuminance:
+    def test_matches_weighted_channel_sum(self):
+        img = np.random.rand(12, 10, 3).astype(np.float32)
+        expected = 0.2126 * img[:, :, 0] + 0.7152 * img[:, :, 1] + 0.0722 * img[:, :, 2]
+
+        lum = core._luminance(img)
+
+        assert lum.shape == (12, 10)
+        assert lum.dtype == np.float32
+        np.testing.assert_allclose(lum, expected, rtol=1e-6, atol=1e-6)
+
+    def test_tracked_tone_eq_luminance_matches_result(self):
+        img = np.random.rand(12, 10, 3).astype(np.float32) * 1.5
+        for highlights in (-0.5, 0.4):
+            result, lum = core._apply_tone_eq_numpy(
+                img.copy(), 0.05, 1 / 0.85, 0.3, highlights, track_lum=True
+            )
+
+            np.testing.assert_allclose(
+                lum, core._luminance(result), rtol=1e-5, atol=1e-5
+            )
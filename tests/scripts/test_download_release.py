@@ -3,7 +3,9 @@
 
 import io
 import json
+import subprocess
 import sys
+import urllib.error
 import zipfile
 from pathlib import Path
 from unittest.mock import MagicMock, patch
@@ -17,8 +19,10 @@ from download_release import (
     check_update_available,
     download_and_extract,
     get_latest_version,
+    load_release_cache,
     load_version,
     main,
+    save_release_cache,
     save_version,
 )
 
@@ -26,7 +30,8 @@ from download_release import (
 def create_mock_urlopen_response(data: bytes):
     """Create a mock response object that supports context manager protocol."""
     mock_response = MagicMock()
-    mock_response.read.return_value = data
+    # Back read() with a real stream so chunked reads terminate
+    mock_response.read.side_effect = io.BytesIO(data).read
     mock_response.__enter__ = MagicMock(return_value=mock_response)
     mock_response.__exit__ = MagicMock(return_value=False)
     return mock_response
@@ -72,6 +77,33 @@ class TestGetLatestVersion:
         assert "Checking for latest release" in captured.out
         assert "Latest release found: v1.0.0" in captured.out
 
+    def test_saves_etag_to_release_cache(self, tmp_path):
+        """The ETag of a successful lookup is cached in the install dir."""
+        mock_response = create_mock_urlopen_response(
+            json.dumps({"tag_name": "v1.2.3"}).encode()
+        )
+        mock_response.headers = {"ETag": '"abc123"'}
+
+        with patch("urllib.request.urlopen", return_value=mock_response):
+            result = get_latest_version("owner/repo", install_dir=str(tmp_path))
+
+        assert result == "v1.2.3"
+        assert load_release_cache(str(tmp_path)) == ('"abc123"', "v1.2.3")
+
+    def test_not_modified_returns_cached_tag(self, tmp_path):
+        """A 304 reply reuses the cached tag without reading a body."""
+        save_release_cache(str(tmp_path), '"abc123"', "v1.2.3")
+        not_modified = urllib.error.HTTPError(
+            "https://api.github.com", 304, "Not Modified", {}, None
+        )
+
+        with patch("urllib.request.urlopen", side_effect=not_modified) as urlopen:
+            result = get_latest_version("owner/repo", install_dir=str(tmp_path))
+
+        assert result == "v1.2.3"
+        request = urlopen.call_args[0][0]
+        assert request.get_header("If-none-match") == '"abc123"'
+
 
 class TestDownloadAndExtract:
     """Tests for download_and_extract function."""
@@ -119,6 +151,27 @@ class TestDownloadAndExtract:
 
         assert result is True
 
+    def test_download_streams_to_temp_file(self, tmp_path):
+        """Test that the zip is streamed to disk in chunks and cleaned up."""
+        dest_dir = str(tmp_path / "install")
+        repo = "owner/repo"
+
+        zip_buffer = io.BytesIO()
+        with zipfile.ZipFile(zip_buffer, "w", zipfile.ZIP_DEFLATED) as zf:
+            zf.writestr("pyNegative-v1.0.0/README.md", "# Test")
+        zip_buffer.seek(0)
+
+        mock_response = create_mock_urlopen_response(zip_buffer.read())
+
+        with patch("urllib.request.urlopen", return_value=mock_response):
+            with patch("subprocess.run"):
+                result = download_and_extract("v1.0.0", dest_dir, repo, verbose=False)
+
+        assert result is True
+        # Every read was a bounded chunk, never a whole-body read
+        assert all(call.args for call in mock_response.read.call_args_list)
+        assert not (tmp_path / "install.zip.tmp").exists()
+
     def test_download_network_error(self, tmp_path):
         """Test handling of network error during download."""
         dest_dir = str(tmp_path / "install")
@@ -221,6 +274,40 @@ class TestDownloadAndExtract:
         captured = capsys.readouterr()
         assert "Warning: Icon generation failed" in captured.out
 
+    def _icon_zip_response(self):
+        zip_buffer = io.BytesIO()
+        with zipfile.ZipFile(zip_buffer, "w", zipfile.ZIP_DEFLATED) as zf:
+            zf.writestr("pyNegative-v1.0.0/README.md", "# Test")
+            zf.writestr("pyNegative-v1.0.0/scripts/generate_icons.py", "# Icon gen")
+        return create_mock_urlopen_response(zip_buffer.getvalue())
+
+    def test_icon_generation_timeout_warning(self, tmp_path, capsys):
+        """A hung icon step is bounded by a timeout and only warns."""
+        dest_dir = str(tmp_path / "install")
+
+        with patch("urllib.request.urlopen", return_value=self._icon_zip_response()):
+            with patch("subprocess.run") as mock_subprocess:
+                mock_subprocess.side_effect = subprocess.TimeoutExpired("uv", 120)
+                result = download_and_extract("v1.0.0", dest_dir, "owner/repo")
+
+        assert result is True
+        assert mock_subprocess.call_args.kwargs["timeout"] == 120
+        assert "timed out" in capsys.readouterr().out
+
+    def test_icon_generation_without_uv_uses_current_python(self, tmp_path):
+        """When uv is not on PATH the script runs with sys.executable."""
+        dest_dir = str(tmp_path / "install")
+
+        with patch("urllib.request.urlopen", return_value=self._icon_zip_response()):
+            with patch("shutil.which", return_value=None):
+                with patch("subprocess.run") as mock_subprocess:
+                    mock_subprocess.return_value = MagicMock(returncode=0)
+                    download_and_extract("v1.0.0", dest_dir, "owner/repo")
+
+        call_args = mock_subprocess.call_args[0][0]
+        assert call_args[0] == sys.executable
+        assert call_args[1].endswith("generate_icons.py")
+
 
 class TestCheckUpdateAvailable:
     """Tests for check_update_available function."""
@@ -0,0 +1,44 @@
+#!/usr/bin/env python3
+"""Unit tests for the generate_icons.py script."""
+
+import sys
+from pathlib import Path
+from unittest.mock import patch
+
+from PIL import Image
+
+# Add scripts directory to path
+sys.path.insert(0, str(Path(__file__).parent.parent.parent / "scripts"))
+
+from generate_icons import build_icon_pyramid
+
+
+class TestBuildIconPyramid:
+    """Tests for build_icon_pyramid function."""
+
+    def test_builds_every_requested_size(self):
+        """Test that each size is produced once as a square RGBA image."""
+        img = Image.new("RGBA", (512, 512), (200, 50, 50, 255))
+        icons = build_icon_pyramid(img, [16, 256, 32, 16, 48])
+
+        assert sorted(icons) == [16, 32, 48, 256]
+        for size, icon in icons.items():
+            assert icon.size == (size, size)
+            assert icon.mode == "RGBA"
+
+    def test_small_sizes_resample_from_pyramid(self):
+        """Test that small icons are built from a larger level, not the source."""
+        img = Image.new("RGBA", (1024, 1024), (0, 0, 255, 255))
+        sources = []
+        original_resize = Image.Image.resize
+
+        def tracking_resize(self, size, *args, **kwargs):
+            # RGBA resizes recurse internally through premultiplied "RGBa"
+            if self.mode == "RGBA":
+                sources.append((self.size[0], size[0]))
+            return original_resize(self, size, *args, **kwargs)
+
+        with patch.object(Image.Image, "resize", tracking_resize):
+            build_icon_pyramid(img, [512, 256, 64, 16])
+
+        assert sources == [(1024, 512), (512, 256), (256, 64), (64, 16)]
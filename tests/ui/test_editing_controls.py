@@ -0,0 +1,29 @@
+from pynegative.ui.editingcontrols import EditingControls
+
+
+def test_reset_sliders_restores_defaults(qtbot):
+    """reset_sliders walks the registered sliders and restores each default."""
+    controls = EditingControls()
+    qtbot.addWidget(controls)
+
+    controls.set_slider_value("val_exposure", 1.5, silent=True)
+    controls.set_slider_value("val_contrast", 1.4, silent=True)
+    controls.reset_sliders(silent=True)
+
+    assert controls.val_exposure == 0.0
+    assert controls.val_contrast == 1.0
+    assert controls.val_exposure_label.text() == "0.00"
+
+
+def test_slider_drag_updates_value_label(qtbot):
+    """Dragging a slider keeps the value label in sync with the setting."""
+    controls = EditingControls()
+    qtbot.addWidget(controls)
+    emitted = []
+    controls.settingChanged.connect(lambda name, val: emitted.append((name, val)))
+
+    controls.val_exposure_slider.setValue(1234)
+    controls.val_exposure_slider.setValue(1236)
+
+    assert controls.val_exposure_label.text() == "1.24"
+    assert emitted == [("exposure", 1.234), ("exposure", 1.236)]
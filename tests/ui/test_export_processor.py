@@ -0,0 +1,100 @@
+import tempfile
+import threading
+from pathlib import Path
+from unittest.mock import MagicMock, patch
+
+import numpy as np
+
+from pynegative import core
+from pynegative.ui.exportprocessor import ExportProcessor
+
+
+def _make_processor(files, max_workers=3):
+    signals = MagicMock()
+    processor = ExportProcessor(
+        signals, files, {"format": "JPEG"}, "/tmp", max_workers=max_workers
+    )
+    return processor, signals
+
+
+def test_run_exports_all_files_concurrently():
+    """Every file is exported and progress reaches 100%."""
+    files = [f"/photos/img_{i}.cr2" for i in range(6)]
+    processor, signals = _make_processor(files)
+
+    with patch.object(
+        processor, "_export_file", side_effect=lambda f: "success"
+    ) as export:
+        processor.run()
+
+    assert export.call_count == 6
+    assert signals.fileProcessed.emit.call_count == 6
+    signals.progress.emit.assert_called_with(100)
+    signals.batchCompleted.emit.assert_called_once_with(6, 0, 6)
+
+
+def test_run_counts_skipped_files():
+    files = ["/photos/a.cr2", "/photos/b.cr2"]
+    processor, signals = _make_processor(files)
+
+    results = {"/photos/a.cr2": "success", "/photos/b.cr2": "skipped"}
+    with patch.object(processor, "_export_file", side_effect=results.get):
+        processor.run()
+
+    signals.batchCompleted.emit.assert_called_once_with(1, 1, 2)
+
+
+def test_run_stops_after_error():
+    """A failing file reports an error and pending files are not started."""
+    files = [f"/photos/img_{i}.cr2" for i in range(20)]
+    processor, signals = _make_processor(files, max_workers=1)
+
+    with patch.object(
+        processor, "_export_file", side_effect=RuntimeError("decode failed")
+    ) as export:
+        processor.run()
+
+    assert export.call_count < len(files)
+    signals.error.emit.assert_called_once()
+    assert "decode failed" in signals.error.emit.call_args[0][0]
+
+
+def test_run_with_no_files():
+    processor, signals = _make_processor([])
+    processor.run()
+    signals.batchCompleted.emit.assert_called_once_with(0, 0, 0)
+
+
+def test_run_decodes_several_raws_at_once():
+    """Export workers decode their RAWs in parallel, not one after another."""
+    decoding = threading.Barrier(3, timeout=5)
+
+    def imread(file):
+        raw = MagicMock()
+
+        def postprocess(**kwargs):
+            # Only returns once all three decodes are in flight together
+            decoding.wait()
+            return np.full((8, 12, 3), 128, dtype=np.uint8)
+
+        raw.postprocess.side_effect = postprocess
+        return raw
+
+    with tempfile.TemporaryDirectory() as src, tempfile.TemporaryDirectory() as dst:
+        files = [Path(src) / f"img_{i}.cr2" for i in range(3)]
+        for file in files:
+            file.write_bytes(bytes(64))
+        signals = MagicMock()
+        processor = ExportProcessor(
+            signals, files, {"format": "JPEG"}, dst, max_workers=3
+        )
+
+        with (
+            patch.object(core.rawpy, "imread", side_effect=imread),
+            patch.dict(core._RAW_HANDLES, clear=True),
+        ):
+            processor.run()
+
+        signals.error.emit.assert_not_called()
+        signals.batchCompleted.emit.assert_called_once_with(3, 0, 3)
+        assert len(list(Path(dst).glob("*.jpg"))) == 3
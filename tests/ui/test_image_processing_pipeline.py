@@ -0,0 +1,251 @@
+import numpy as np
+from unittest.mock import MagicMock, patch
+from PySide6 import QtCore, QtGui
+
+from pynegative import core
+from pynegative.ui.imageprocessing import ImageProcessingPipeline, ImageProcessorWorker
+
+
+def _make_pipeline():
+    thread_pool = MagicMock()
+    pipeline = ImageProcessingPipeline(thread_pool)
+    pipeline.base_img_full = np.zeros((8, 8, 3), dtype=np.float32)
+    pipeline.set_view_reference(MagicMock())
+    return pipeline, thread_pool
+
+
+def test_request_update_coalesces_bursts(qtbot):
+    """Several requests within one frame should start a single worker."""
+    pipeline, thread_pool = _make_pipeline()
+
+    for _ in range(10):
+        pipeline.request_update()
+
+    assert thread_pool.start.call_count == 0
+    qtbot.waitUntil(lambda: thread_pool.start.call_count == 1, timeout=1000)
+    assert not pipeline._render_pending
+
+
+def test_request_update_waits_for_busy_worker(qtbot):
+    """A request made while a worker is running is deferred until it finishes."""
+    pipeline, thread_pool = _make_pipeline()
+    pipeline._is_rendering_locked = True
+
+    pipeline.request_update()
+    qtbot.wait(50)
+
+    assert thread_pool.start.call_count == 0
+    assert pipeline._render_pending
+
+
+def test_unedited_pixmap_cached_as_uint8(qtbot):
+    """The unedited comparison image is converted once when the image is set."""
+    pipeline = ImageProcessingPipeline(MagicMock())
+    img = np.random.rand(64, 48, 3).astype(np.float32)
+
+    pipeline.set_image(img)
+
+    assert pipeline._unedited_uint8.dtype == np.uint8
+    np.testing.assert_array_equal(
+        pipeline._unedited_uint8, (img * 255).astype(np.uint8)
+    )
+    pixmap = pipeline.get_unedited_pixmap()
+    assert pixmap.width() == 48
+    assert pixmap.height() == 64
+
+
+def _make_view(width=64, height=48):
+    view = MagicMock()
+    view.transform.return_value.m11.return_value = 0.1
+    view.viewport.return_value.width.return_value = width
+    view.viewport.return_value.height.return_value = height
+    view._is_fitting = True
+    return view
+
+
+def _run_worker(pipeline, settings):
+    signals = MagicMock()
+    worker = ImageProcessorWorker(
+        signals,
+        _make_view(),
+        pipeline.base_img_full,
+        pipeline.base_img_half,
+        pipeline.base_img_quarter,
+        pipeline.base_img_preview,
+        settings,
+        1,
+        cache=pipeline.cache,
+        base_img_preview_u8=pipeline.base_img_preview_u8,
+    )
+    return worker._update_preview()
+
+
+def test_sharpen_cache_key_tracks_stage_input(qtbot):
+    """Amount changes share a sharpen cache key; a new image gets a fresh one."""
+    pipeline = ImageProcessingPipeline(MagicMock())
+    pipeline.set_image(np.random.rand(96, 128, 3).astype(np.float32))
+    settings = {"sharpen_value": 1.0, "sharpen_radius": 1.5, "sharpen_percent": 50}
+
+    with patch.object(core, "sharpen_image", wraps=core.sharpen_image) as sharpen:
+        _run_worker(pipeline, settings)
+        _run_worker(pipeline, {**settings, "sharpen_percent": 150})
+        pipeline.set_image(np.random.rand(96, 128, 3).astype(np.float32))
+        _run_worker(pipeline, settings)
+
+    keys = [c.kwargs["cache_key"] for c in sharpen.call_args_list]
+    assert len(keys) == 3 and keys[0] is not None
+    assert keys[0] == keys[1] != keys[2]
+
+
+def test_zoomed_roi_is_tone_mapped_from_contiguous_pixels(qtbot):
+    """The ROI crop is made contiguous so it hits the warmed-up Numba kernel."""
+    pipeline = ImageProcessingPipeline(MagicMock())
+    pipeline.set_image(np.random.rand(96, 128, 3).astype(np.float32))
+    view = _make_view()
+    view.transform.return_value.m11.return_value = 2.0
+    view._is_fitting = False
+    view.mapToScene.return_value.boundingRect.return_value = QtCore.QRectF(
+        10, 20, 40, 30
+    )
+    worker = ImageProcessorWorker(
+        MagicMock(),
+        view,
+        pipeline.base_img_full,
+        pipeline.base_img_half,
+        pipeline.base_img_quarter,
+        pipeline.base_img_preview,
+        {"exposure": 0.5},
+        1,
+        cache=pipeline.cache,
+    )
+
+    with patch.object(core, "process_to_uint8", wraps=core.process_to_uint8) as process:
+        roi_w = worker._update_preview()[6]
+
+    assert roi_w == 40
+    assert all(c.args[0].flags.c_contiguous for c in process.call_args_list)
+    assert any(c.args[0].shape[:2] == (30, 40) for c in process.call_args_list)
+
+
+def test_lut_preview_matches_float_preview(qtbot):
+    """The uint8 LUT background matches the float pipeline within rounding."""
+    pipeline = ImageProcessingPipeline(MagicMock())
+    pipeline.set_image(np.random.rand(96, 128, 3).astype(np.float32))
+    settings = {"exposure": 0.5, "contrast": 1.1, "temperature": 0.2}
+
+    lut_pix = _run_worker(pipeline, settings)[0].toImage()
+    pipeline.base_img_preview_u8 = None
+    float_pix = _run_worker(pipeline, settings)[0].toImage()
+
+    assert lut_pix.size() == float_pix.size()
+    for x, y in ((0, 0), (100, 50), (500, 300)):
+        lut_px, float_px = lut_pix.pixelColor(x, y), float_pix.pixelColor(x, y)
+        assert abs(lut_px.red() - float_px.red()) <= 2
+        assert abs(lut_px.blue() - float_px.blue()) <= 2
+
+
+def test_set_image_builds_resolution_tiers(qtbot):
+    """Tiers keep their expected sizes when built as an area pyramid."""
+    pipeline = ImageProcessingPipeline(MagicMock())
+    img = np.full((3000, 4500, 3), 0.25, dtype=np.float32)
+
+    pipeline.set_image(img)
+
+    assert pipeline.base_img_half.shape == (1500, 2250, 3)
+    assert pipeline.base_img_quarter.shape == (750, 1125, 3)
+    assert pipeline.base_img_preview.shape == (1365, 2048, 3)
+    np.testing.assert_allclose(pipeline.base_img_preview, 0.25, atol=1e-3)
+
+
+def _finish(pipeline, request_id):
+    """Deliver a worker result for ``request_id`` as the finished signal would."""
+    pixmap = QtGui.QPixmap()
+    pipeline._on_worker_finished(pixmap, 8, 8, pixmap, 0, 0, 0, 0, request_id)
+
+
+def test_unchanged_request_is_skipped(qtbot):
+    """Re-requesting the frame already rendered does not start a worker."""
+    pipeline, thread_pool = _make_pipeline()
+    pipeline.set_processing_params(exposure=0.5)
+
+    pipeline._render_pending = True
+    pipeline._process_pending_update()
+    _finish(pipeline, thread_pool.start.call_args[0][0].request_id)
+    pipeline._render_pending = True
+    pipeline._process_pending_update()
+    assert thread_pool.start.call_count == 1
+
+    pipeline.set_processing_params(exposure=0.6)
+    pipeline._render_pending = True
+    pipeline._process_pending_update()
+    assert thread_pool.start.call_count == 2
+
+
+def test_dropped_result_does_not_suppress_rerequest(qtbot):
+    """A frame that never reached the screen is rendered again when re-requested."""
+    pipeline, thread_pool = _make_pipeline()
+    pipeline.set_processing_params(exposure=0.5)
+
+    pipeline._render_pending = True
+    pipeline._process_pending_update()
+    request_id = thread_pool.start.call_args[0][0].request_id
+    # A newer frame was shown meanwhile, so this result is discarded as stale
+    pipeline._last_processed_id = request_id + 1
+    _finish(pipeline, request_id)
+    pipeline._render_pending = True
+    pipeline._process_pending_update()
+    assert thread_pool.start.call_count == 2
+
+    pipeline._on_worker_error("boom", thread_pool.start.call_args[0][0].request_id)
+    pipeline._render_pending = True
+    pipeline._process_pending_update()
+    assert thread_pool.start.call_count == 3
+
+
+def test_float_preview_built_only_when_needed(qtbot):
+    """LUT-only edits never materialise the float32 preview tier."""
+    pipeline, thread_pool = _make_pipeline()
+    pipeline.set_image(np.random.rand(96, 128, 3).astype(np.float32))
+    assert pipeline._base_img_preview is None
+
+    pipeline.set_processing_params(exposure=0.5)
+    pipeline._render_pending = True
+    pipeline._process_pending_update()
+    assert pipeline._base_img_preview is None
+    assert thread_pool.start.call_args[0][0].base_img_preview is None
+
+    pipeline._is_rendering_locked = False
+    pipeline.set_processing_params(saturation=1.3)
+    pipeline._render_pending = True
+    pipeline._process_pending_update()
+    assert pipeline._base_img_preview.dtype == np.float32
+    assert pipeline._base_img_preview.shape == (1536, 2048, 3)
+
+
+def test_background_renders_into_reused_buffer(qtbot):
+    """Consecutive LUT renders write into the pipeline's scratch buffer."""
+    pipeline = ImageProcessingPipeline(MagicMock())
+    pipeline.set_image(np.random.rand(96, 128, 3).astype(np.float32))
+    buffer = pipeline._preview_out
+    assert buffer.shape == pipeline.base_img_preview_u8.shape
+
+    signals = MagicMock()
+    worker = ImageProcessorWorker(
+        signals,
+        _make_view(),
+        pipeline.base_img_full,
+        pipeline.base_img_half,
+        pipeline.base_img_quarter,
+        None,
+        {"exposure": 1.0},
+        1,
+        base_img_preview_u8=pipeline.base_img_preview_u8,
+        preview_out=buffer,
+    )
+    pix = worker._update_preview()[0]
+
+    lut = core.build_tone_lut(exposure=1.0)
+    np.testing.assert_array_equal(
+        buffer, core.apply_tone_lut(pipeline.base_img_preview_u8, lut)
+    )
+    assert pix.width() == 2048
@@ -0,0 +1,50 @@
+import threading
+
+from pynegative import core
+from pynegative.ui.settingsmanager import SettingsManager
+
+
+def test_auto_save_sidecar_writes_in_background(qtbot, tmp_path):
+    """Auto-save is queued off the UI thread and lands on disk in order."""
+    raw_path = tmp_path / "photo.cr2"
+    raw_path.touch()
+    manager = SettingsManager()
+
+    manager.auto_save_sidecar(raw_path, {"exposure": 0.5}, 2)
+    manager.auto_save_sidecar(raw_path, {"exposure": 1.0}, 3)
+    manager.wait_for_pending_save()
+
+    assert core.load_sidecar(raw_path) == {"exposure": 1.0, "rating": 3}
+
+
+def test_paste_waits_for_pending_save(qtbot, tmp_path):
+    """Pasting reads the rating written by a still-queued auto-save."""
+    raw_path = tmp_path / "photo.cr2"
+    raw_path.touch()
+    manager = SettingsManager()
+    manager.settings_clipboard = {"contrast": 1.3}
+
+    manager.auto_save_sidecar(raw_path, {"exposure": 0.5}, 4)
+    manager.paste_settings_to_selected([str(raw_path)])
+
+    assert core.load_sidecar(raw_path) == {"contrast": 1.3, "rating": 4}
+
+
+def test_sidecar_reads_wait_for_pending_save(qtbot, tmp_path):
+    """Reopening a photo or reloading its folder sees a still-queued auto-save."""
+    raw_path = tmp_path / "photo.cr2"
+    raw_path.touch()
+    manager = SettingsManager()
+    release = threading.Event()
+    # Hold the writer so the auto-save below is still queued when we read
+    blocker = core._SIDECAR_WRITER.submit(release.wait, 5)
+
+    manager.auto_save_sidecar(raw_path, {"exposure": 0.7}, 5)
+    threading.Timer(0.2, release.set).start()
+    assert core.load_sidecar(raw_path) == {"exposure": 0.7, "rating": 5}
+    assert blocker.done()
+
+    manager.auto_save_sidecar(raw_path, {"exposure": 0.9}, 1)
+    assert core.load_sidecars_for_dir(tmp_path) == {
+        "photo.cr2": {"exposure": 0.9, "rating": 1}
+    }
@@ -1,4 +1,5 @@
 import pytest
+from unittest.mock import patch
 from PySide6 import QtWidgets, QtCore, QtGui
 from PySide6.QtCore import Qt
 from pynegative.ui.widgets.zoomablegraphicsview import ZoomableGraphicsView
@@ -70,6 +71,19 @@ class TestZoomableGraphicsView:
         assert zoom_view._fg_item.pos() == QtCore.QPointF(10, 20)
         assert zoom_view._scene.sceneRect() == QtCore.QRectF(0, 0, 100, 100)
 
+    def test_set_pixmaps_same_geometry_keeps_scene(self, zoom_view, sample_pixmap):
+        """Repeated frames of the same size only swap the pixmap."""
+        zoom_view.set_pixmaps(sample_pixmap, 200, 200)
+
+        with patch.object(zoom_view._scene, "setSceneRect") as set_rect:
+            new_pixmap = QtGui.QPixmap(100, 100)
+            new_pixmap.fill(QtGui.QColor("green"))
+            zoom_view.set_pixmaps(new_pixmap, 200, 200)
+
+        set_rect.assert_not_called()
+        assert zoom_view._bg_item.pixmap().cacheKey() == new_pixmap.cacheKey()
+        assert zoom_view._bg_item.transform().m11() == 2.0
+
     def test_reset_zoom_with_no_content(self, zoom_view):
         """Test reset_zoom when there's no content."""
         zoom_view.reset_zoom()